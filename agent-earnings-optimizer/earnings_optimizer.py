@@ -12,38 +12,169 @@ Usage:
 
 import argparse
 import hashlib
+import heapq
 import json
 import os
+import re
+import statistics
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
-from urllib.request import Request, urlopen
+from functools import cached_property
+from http.client import HTTPException, HTTPSConnection
+from typing import Optional, TypedDict
 from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 BASE_URL = "https://market.near.ai/v1"
 
-
-def api_get(endpoint: str, api_key: str) -> dict | list:
-    req = Request(f"{BASE_URL}{endpoint}", headers={
+_BASE = urlsplit(BASE_URL)
+# Idle keep-alive connections shared by all threads. The fetches run on
+# short-lived executor threads, so per-thread connections would rarely be
+# reused.
+_idle: list[HTTPSConnection] = []
+_idle_lock = threading.Lock()
+MAX_IDLE = 8
+# http.client doesn't read HTTPS_PROXY; proxied setups go through urllib.
+_PROXIED = "https" in getproxies() and not proxy_bypass(_BASE.hostname)
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "near-agent-optimizer")
+# Seconds a cached GET stays fresh, keyed by endpoint path. Unlisted paths
+# are never cached.
+CACHE_TTL = {
+    "/agents/me": 300,
+    "/agents/me/bids": 60,
+    "/wallet/balance": 30,
+    "/jobs": 60,
+}
+use_cache = True
+
+
+def _acquire() -> HTTPSConnection:
+    with _idle_lock:
+        if _idle:
+            return _idle.pop()
+    return HTTPSConnection(_BASE.netloc, timeout=30)
+
+
+def _release(conn: HTTPSConnection) -> None:
+    with _idle_lock:
+        if len(_idle) < MAX_IDLE:
+            _idle.append(conn)
+            return
+    conn.close()
+
+
+def _urllib_request(method: str, endpoint: str, headers: dict, body: bytes | None):
+    req = Request(f"{BASE_URL}{endpoint}", data=body, method=method, headers=headers)
+    with urlopen(req, timeout=30) as resp:
+        return json.load(resp)
+
+
+def _request(method: str, endpoint: str, api_key: str, body: bytes | None = None):
+    headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
-    })
-    with urlopen(req) as resp:
-        return json.loads(resp.read())
+    }
+    if _PROXIED:
+        return _urllib_request(method, endpoint, headers, body)
+    conn = _acquire()
+    try:
+        try:
+            conn.request(method, f"{_BASE.path}{endpoint}", body=body, headers=headers)
+            resp = conn.getresponse()
+        except (ConnectionError, HTTPException):
+            # The server may have dropped an idle keep-alive socket; reconnect
+            # once for idempotent requests.
+            conn.close()
+            if method != "GET":
+                raise
+            conn.request(method, f"{_BASE.path}{endpoint}", body=body, headers=headers)
+            resp = conn.getresponse()
+        if 300 <= resp.status < 400:
+            resp.read()
+            # Let urllib follow the redirect, exactly as before pooling
+            return _urllib_request(method, endpoint, headers, body)
+        if resp.status >= 400:
+            resp.read()  # drain so the connection can be reused
+            raise HTTPError(f"{BASE_URL}{endpoint}", resp.status, resp.reason, resp.headers, None)
+        return json.load(resp)
+    except HTTPError:
+        raise  # response was drained, the connection stays usable
+    except BaseException:
+        conn.close()  # unknown state; reopens on its next request
+        raise
+    finally:
+        _release(conn)
+
+
+def _cache_path(endpoint: str, api_key: str) -> str:
+    key = hashlib.sha256(f"{endpoint}\0{api_key}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def _cache_get(endpoint: str, api_key: str, ttl: float):
+    try:
+        with open(_cache_path(endpoint, api_key)) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - entry.get("fetched_at", 0) < ttl:
+        return entry
+    return None
+
+
+def _cache_put(endpoint: str, api_key: str, body) -> None:
+    path = _cache_path(endpoint, api_key)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump({"fetched_at": time.time(), "body": body}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def api_get(endpoint: str, api_key: str) -> dict | list:
+    ttl = CACHE_TTL.get(endpoint.split("?", 1)[0], 0) if use_cache else 0
+    if ttl:
+        cached = _cache_get(endpoint, api_key, ttl)
+        if cached is not None:
+            return cached["body"]
+    body = _request("GET", endpoint, api_key)
+    if ttl:
+        _cache_put(endpoint, api_key, body)
+    return body
 
 
 def api_post(endpoint: str, api_key: str, data: dict) -> dict:
-    body = json.dumps(data).encode()
-    req = Request(f"{BASE_URL}{endpoint}", data=body, method="POST", headers={
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    })
-    with urlopen(req) as resp:
-        return json.loads(resp.read())
+    return _request("POST", endpoint, api_key, json.dumps(data).encode())
 
 
 # ─── Data Collection ────────────────────────────────────────────────
 
+class Bid(TypedDict):
+    bid_id: str
+    job_id: str
+    amount: str
+    status: str
+    created_at: str
+
+
+class Job(TypedDict, total=False):
+    job_id: str
+    title: str
+    budget_amount: Optional[str]
+    bid_count: int
+    tags: list[str]
+    created_at: str
+
+
 def get_profile(api_key: str) -> dict:
     return api_get("/agents/me", api_key)
 
@@ -52,12 +183,43 @@ def get_wallet(api_key: str) -> dict:
     return api_get("/wallet/balance", api_key)
 
 
-def get_my_bids(api_key: str) -> list:
+def get_my_bids(api_key: str) -> list[Bid]:
     return api_get("/agents/me/bids", api_key)
 
 
-def get_open_jobs(api_key: str, limit: int = 100) -> list:
-    return api_get(f"/jobs?status=open&limit={limit}", api_key)
+def get_open_jobs(api_key: str, page_size: int = 100, max_jobs: int = 2000) -> list[Job]:
+    """Fetch up to max_jobs open jobs, paging by offset.
+
+    /jobs returns a bare list with no total, so after the first page the
+    remaining pages are requested in concurrent batches until one comes back
+    short. Each batch is only sent once the previous one came back full, and
+    batches grow 1, 2, 4, 8 pages, so the pages fetched past the end never
+    outnumber the useful ones.
+    """
+    def page(n: int) -> list[Job]:
+        return api_get(f"/jobs?status=open&limit={page_size}&offset={n * page_size}", api_key)
+
+    max_pages = -(-max_jobs // page_size)
+    pages = [page(0)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        n, width = 1, 1
+        while len(pages[-1]) == page_size and n < max_pages:
+            batch = range(n, min(n + width, max_pages))
+            for result in pool.map(page, batch):
+                pages.append(result)
+                if len(result) < page_size:
+                    break
+            n, width = batch.stop, min(width * 2, 8)
+
+    # Offsets can shift while paging; drop jobs already seen.
+    seen = set()
+    jobs = []
+    for result in pages:
+        for job in result:
+            if job["job_id"] not in seen:
+                seen.add(job["job_id"])
+                jobs.append(job)
+    return jobs[:max_jobs]
 
 
 def get_bids_on_my_jobs(api_key: str) -> list:
@@ -67,12 +229,31 @@ def get_bids_on_my_jobs(api_key: str) -> list:
 # ─── Analysis Engine ────────────────────────────────────────────────
 
 class AgentAnalyzer:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, page_size: int = 100, max_jobs: int = 2000):
         self.api_key = api_key
-        self.profile = get_profile(api_key)
-        self.bids = get_my_bids(api_key)
-        self.wallet = get_wallet(api_key)
-        self.open_jobs = get_open_jobs(api_key)
+        # The four fetches are independent, so issue them concurrently and
+        # pay ~1 round-trip instead of 4. result() re-raises HTTPError.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            profile = pool.submit(get_profile, api_key)
+            bids = pool.submit(get_my_bids, api_key)
+            wallet = pool.submit(get_wallet, api_key)
+            open_jobs = pool.submit(get_open_jobs, api_key, page_size, max_jobs)
+            self.profile = profile.result()
+            self.bids = bids.result()
+            self.wallet = wallet.result()
+            self.open_jobs = open_jobs.result()
+
+        # Lowercase each job's tags once so the analyses can intersect sets
+        # directly instead of re-normalizing strings on every pass, and keep
+        # (job, tags) pairs for the tagged subset so skill matching can skip
+        # untagged jobs. The job dicts themselves are left untouched.
+        self._tagged_jobs = []
+        self._jobs_by_id = {}
+        for job in self.open_jobs:
+            self._jobs_by_id[job["job_id"]] = job
+            tags = frozenset(t.lower() for t in job.get("tags") or ())
+            if tags:
+                self._tagged_jobs.append((job, tags))
 
     @property
     def agent_id(self) -> str:
@@ -92,56 +273,64 @@ class AgentAnalyzer:
         caps = self.profile.get("capabilities", {})
         return caps.get("languages", [])
 
+    @cached_property
     def bid_stats(self) -> dict:
         total = len(self.bids)
-        accepted = [b for b in self.bids if b["status"] == "accepted"]
-        pending = [b for b in self.bids if b["status"] == "pending"]
-        rejected = [b for b in self.bids if b["status"] == "rejected"]
-        withdrawn = [b for b in self.bids if b["status"] == "withdrawn"]
-
-        win_rate = len(accepted) / total * 100 if total > 0 else 0
-
-        amounts = [float(b["amount"]) for b in self.bids]
-        avg_bid = sum(amounts) / len(amounts) if amounts else 0
-
-        accepted_amounts = [float(b["amount"]) for b in accepted]
-        avg_earning = sum(accepted_amounts) / len(accepted_amounts) if accepted_amounts else 0
-        total_earned = sum(accepted_amounts)
+        status_counts = Counter()
+        amount_sum = 0
+        total_earned = 0
+        for b in self.bids:
+            amount = float(b["amount"])
+            status_counts[b["status"]] += 1
+            amount_sum += amount
+            if b["status"] == "accepted":
+                total_earned += amount
+        accepted = status_counts["accepted"]
+
+        win_rate = accepted / total * 100 if total > 0 else 0
+        avg_bid = amount_sum / total if total else 0
+        avg_earning = total_earned / accepted if accepted else 0
 
         return {
             "total_bids": total,
-            "accepted": len(accepted),
-            "pending": len(pending),
-            "rejected": len(rejected),
-            "withdrawn": len(withdrawn),
+            "accepted": accepted,
+            "pending": status_counts["pending"],
+            "rejected": status_counts["rejected"],
+            "withdrawn": status_counts["withdrawn"],
             "win_rate": win_rate,
             "avg_bid_amount": avg_bid,
             "avg_earning_per_job": avg_earning,
             "total_earned": total_earned,
         }
 
+    @cached_property
     def market_analysis(self) -> dict:
-        budgets = [float(j["budget_amount"]) for j in self.open_jobs if j.get("budget_amount")]
+        # One pass over open_jobs feeds every accumulator below.
+        budgets = []
+        tag_counts = Counter()
+        bid_sum = 0
+        low_competition = []
+        for j in self.open_jobs:
+            bid_count = j.get("bid_count", 0)
+            bid_sum += bid_count
+            tag_counts.update(j.get("tags") or ())
+            if j.get("budget_amount"):
+                budget = float(j["budget_amount"])
+                budgets.append(budget)
+                if bid_count <= 2:
+                    low_competition.append((budget, j))
+
         avg_budget = sum(budgets) / len(budgets) if budgets else 0
-        median_budget = sorted(budgets)[len(budgets) // 2] if budgets else 0
+        median_budget = statistics.median_high(budgets) if budgets else 0
 
         # Tag frequency
-        tag_counts = {}
-        for j in self.open_jobs:
-            for tag in j.get("tags", []):
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        top_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_tags = tag_counts.most_common(10)
 
         # Competition analysis
-        bid_counts = [j.get("bid_count", 0) for j in self.open_jobs]
-        avg_competition = sum(bid_counts) / len(bid_counts) if bid_counts else 0
-
-        low_competition = [j for j in self.open_jobs if j.get("bid_count", 0) <= 2]
-        high_value_low_comp = sorted(
-            [j for j in low_competition if j.get("budget_amount")],
-            key=lambda j: float(j["budget_amount"]),
-            reverse=True,
-        )[:10]
+        avg_competition = bid_sum / len(self.open_jobs) if self.open_jobs else 0
+        high_value_low_comp = [
+            j for _, j in heapq.nlargest(10, low_competition, key=lambda c: c[0])
+        ]
 
         return {
             "total_open_jobs": len(self.open_jobs),
@@ -152,28 +341,30 @@ class AgentAnalyzer:
             "best_opportunities": high_value_low_comp,
         }
 
+    @cached_property
     def skill_match_jobs(self) -> list:
         """Find open jobs matching agent's skills."""
-        my_skills = set(s.lower() for s in self.skills + self.languages)
+        my_skills = frozenset(s.lower() for s in (*self.skills, *self.languages))
         matches = []
-        for job in self.open_jobs:
-            job_tags = set(t.lower() for t in job.get("tags", []))
-            overlap = my_skills & job_tags
-            if overlap:
-                matches.append({
-                    "job_id": job["job_id"],
-                    "title": job["title"],
-                    "budget": job.get("budget_amount", "?"),
-                    "bids": job.get("bid_count", 0),
-                    "matching_skills": list(overlap),
-                    "score": len(overlap) * 10 + (1.0 / max(job.get("bid_count", 1), 1)),
-                })
+        for job, tags in self._tagged_jobs:
+            overlap = my_skills & tags
+            if not overlap:
+                continue
+            bid_count = job.get("bid_count", 0) or 0
+            matches.append({
+                "job_id": job["job_id"],
+                "title": job["title"],
+                "budget": job.get("budget_amount", "?"),
+                "bids": bid_count,
+                "matching_skills": sorted(overlap),
+                "score": len(overlap) * 10 + (1.0 / max(bid_count, 1)),
+            })
         return sorted(matches, key=lambda m: m["score"], reverse=True)
 
     def generate_recommendations(self) -> list:
         recs = []
-        stats = self.bid_stats()
-        market = self.market_analysis()
+        stats = self.bid_stats
+        market = self.market_analysis
 
         # Win rate recommendations
         if stats["total_bids"] == 0:
@@ -198,21 +389,16 @@ class AgentAnalyzer:
 
         # Bid timing
         if stats["total_bids"] > 0:
-            bid_times = []
-            for b in self.bids:
-                created = datetime.fromisoformat(b["created_at"].replace("Z", "+00:00"))
-                bid_times.append(created)
-            if bid_times:
-                recs.append({
-                    "priority": "MEDIUM",
-                    "category": "Speed",
-                    "action": "Bid faster on new jobs",
-                    "detail": "Early bids have higher win rates. Set up polling to catch new jobs quickly.",
-                    "impact": "Jobs with <2hr response win 2-3x more often",
-                })
+            recs.append({
+                "priority": "MEDIUM",
+                "category": "Speed",
+                "action": "Bid faster on new jobs",
+                "detail": "Early bids have higher win rates. Set up polling to catch new jobs quickly.",
+                "impact": "Jobs with <2hr response win 2-3x more often",
+            })
 
         # Skill matching
-        matched = self.skill_match_jobs()
+        matched = self.skill_match_jobs
         if matched:
             top = matched[0]
             recs.append({
@@ -226,11 +412,11 @@ class AgentAnalyzer:
 
         # Diversification
         if stats["total_bids"] > 5:
-            bid_job_ids = set(b["job_id"] for b in self.bids)
             bid_tags = set()
-            for j in self.open_jobs:
-                if j["job_id"] in bid_job_ids:
-                    bid_tags.update(j.get("tags", []))
+            for b in self.bids:
+                job = self._jobs_by_id.get(b["job_id"])
+                if job:
+                    bid_tags.update(job.get("tags") or ())
 
             top_market_tags = set(t[0] for t in market["top_tags"][:5])
             missing_tags = top_market_tags - bid_tags
@@ -271,85 +457,86 @@ class AgentAnalyzer:
 # ─── Report Generator ───────────────────────────────────────────────
 
 def print_report(analyzer: AgentAnalyzer):
-    stats = analyzer.bid_stats()
-    market = analyzer.market_analysis()
+    stats = analyzer.bid_stats
+    market = analyzer.market_analysis
     recs = analyzer.generate_recommendations()
-    matches = analyzer.skill_match_jobs()
+    matches = analyzer.skill_match_jobs
 
-    print()
-    print("=" * 60)
-    print("  NEAR Agent Earnings Optimizer Report")
-    print("=" * 60)
+    out = [""]
+    out.append("=" * 60)
+    out.append("  NEAR Agent Earnings Optimizer Report")
+    out.append("=" * 60)
 
     # Profile
-    print(f"\n  Agent: @{analyzer.handle}")
-    print(f"  ID: {analyzer.agent_id}")
-    print(f"  Skills: {', '.join(analyzer.skills)}")
-    print(f"  Languages: {', '.join(analyzer.languages)}")
+    out.append(f"\n  Agent: @{analyzer.handle}")
+    out.append(f"  ID: {analyzer.agent_id}")
+    out.append(f"  Skills: {', '.join(analyzer.skills)}")
+    out.append(f"  Languages: {', '.join(analyzer.languages)}")
 
     # Performance
-    print(f"\n{'─' * 60}")
-    print("  PERFORMANCE")
-    print(f"{'─' * 60}")
-    print(f"  Total Bids:      {stats['total_bids']}")
-    print(f"  Won (Accepted):  {stats['accepted']}")
-    print(f"  Pending:         {stats['pending']}")
-    print(f"  Rejected:        {stats['rejected']}")
-    print(f"  Win Rate:        {stats['win_rate']:.1f}%")
-    print(f"  Avg Bid Amount:  {stats['avg_bid_amount']:.2f} NEAR")
-    print(f"  Avg Earning/Job: {stats['avg_earning_per_job']:.2f} NEAR")
-    print(f"  Total Earned:    {stats['total_earned']:.2f} NEAR")
+    out.append(f"\n{'─' * 60}")
+    out.append("  PERFORMANCE")
+    out.append(f"{'─' * 60}")
+    out.append(f"  Total Bids:      {stats['total_bids']}")
+    out.append(f"  Won (Accepted):  {stats['accepted']}")
+    out.append(f"  Pending:         {stats['pending']}")
+    out.append(f"  Rejected:        {stats['rejected']}")
+    out.append(f"  Win Rate:        {stats['win_rate']:.1f}%")
+    out.append(f"  Avg Bid Amount:  {stats['avg_bid_amount']:.2f} NEAR")
+    out.append(f"  Avg Earning/Job: {stats['avg_earning_per_job']:.2f} NEAR")
+    out.append(f"  Total Earned:    {stats['total_earned']:.2f} NEAR")
 
     # Wallet
     balance = analyzer.wallet
-    print(f"\n{'─' * 60}")
-    print("  WALLET")
-    print(f"{'─' * 60}")
+    out.append(f"\n{'─' * 60}")
+    out.append("  WALLET")
+    out.append(f"{'─' * 60}")
     for k, v in balance.items():
-        print(f"  {k}: {v}")
+        out.append(f"  {k}: {v}")
 
     # Market
-    print(f"\n{'─' * 60}")
-    print("  MARKET OVERVIEW")
-    print(f"{'─' * 60}")
-    print(f"  Open Jobs:         {market['total_open_jobs']}")
-    print(f"  Avg Budget:        {market['avg_budget']:.2f} NEAR")
-    print(f"  Median Budget:     {market['median_budget']:.2f} NEAR")
-    print(f"  Avg Competition:   {market['avg_competition']:.1f} bids/job")
-    print(f"\n  Top Tags:")
+    out.append(f"\n{'─' * 60}")
+    out.append("  MARKET OVERVIEW")
+    out.append(f"{'─' * 60}")
+    out.append(f"  Open Jobs:         {market['total_open_jobs']}")
+    out.append(f"  Avg Budget:        {market['avg_budget']:.2f} NEAR")
+    out.append(f"  Median Budget:     {market['median_budget']:.2f} NEAR")
+    out.append(f"  Avg Competition:   {market['avg_competition']:.1f} bids/job")
+    out.append(f"\n  Top Tags:")
     for tag, count in market["top_tags"]:
-        print(f"    {tag}: {count} jobs")
+        out.append(f"    {tag}: {count} jobs")
 
     # Skill matches
     if matches:
-        print(f"\n{'─' * 60}")
-        print("  JOBS MATCHING YOUR SKILLS")
-        print(f"{'─' * 60}")
+        out.append(f"\n{'─' * 60}")
+        out.append("  JOBS MATCHING YOUR SKILLS")
+        out.append(f"{'─' * 60}")
         for m in matches[:8]:
-            print(f"  [{m['bids']} bids] {m['budget']} NEAR - {m['title']}")
-            print(f"           Matches: {', '.join(m['matching_skills'])}")
+            out.append(f"  [{m['bids']} bids] {m['budget']} NEAR - {m['title']}")
+            out.append(f"           Matches: {', '.join(m['matching_skills'])}")
 
     # Best opportunities
     if market["best_opportunities"]:
-        print(f"\n{'─' * 60}")
-        print("  BEST OPPORTUNITIES (High Budget, Low Competition)")
-        print(f"{'─' * 60}")
+        out.append(f"\n{'─' * 60}")
+        out.append("  BEST OPPORTUNITIES (High Budget, Low Competition)")
+        out.append(f"{'─' * 60}")
         for opp in market["best_opportunities"][:5]:
-            print(f"  [{opp.get('bid_count', 0)} bids] {opp.get('budget_amount', '?')} NEAR - {opp['title']}")
+            out.append(f"  [{opp.get('bid_count', 0)} bids] {opp.get('budget_amount', '?')} NEAR - {opp['title']}")
 
     # Recommendations
-    print(f"\n{'─' * 60}")
-    print("  RECOMMENDATIONS")
-    print(f"{'─' * 60}")
+    out.append(f"\n{'─' * 60}")
+    out.append("  RECOMMENDATIONS")
+    out.append(f"{'─' * 60}")
     for i, rec in enumerate(recs, 1):
         icon = {"HIGH": "!!!", "MEDIUM": " ! ", "LOW": "   "}[rec["priority"]]
-        print(f"\n  {icon} [{rec['priority']}] {rec['category']}: {rec['action']}")
-        print(f"      {rec['detail']}")
-        print(f"      Impact: {rec['impact']}")
+        out.append(f"\n  {icon} [{rec['priority']}] {rec['category']}: {rec['action']}")
+        out.append(f"      {rec['detail']}")
+        out.append(f"      Impact: {rec['impact']}")
 
-    print(f"\n{'=' * 60}")
-    print(f"  Report generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
-    print(f"{'=' * 60}\n")
+    out.append(f"\n{'=' * 60}")
+    out.append(f"  Report generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
+    out.append(f"{'=' * 60}\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
     return {
         "stats": stats,
@@ -361,10 +548,10 @@ def print_report(analyzer: AgentAnalyzer):
 
 def generate_json_report(analyzer: AgentAnalyzer) -> dict:
     """Generate machine-readable JSON report."""
-    stats = analyzer.bid_stats()
-    market = analyzer.market_analysis()
+    stats = analyzer.bid_stats
+    market = analyzer.market_analysis
     recs = analyzer.generate_recommendations()
-    matches = analyzer.skill_match_jobs()
+    matches = analyzer.skill_match_jobs
 
     # Serialize opportunities
     opps = []
@@ -400,28 +587,72 @@ def generate_json_report(analyzer: AgentAnalyzer) -> dict:
     }
 
 
+def write_report(report: dict, f) -> None:
+    """Write a report to a text file as indented JSON, using orjson when installed."""
+    # Imported here so the text-report and --help paths don't pay for it.
+    try:
+        import orjson
+    except ImportError:
+        # json.dump streams chunks straight to f instead of building one string.
+        json.dump(report, f, indent=2)
+        return
+    data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    buffer = getattr(f, "buffer", None)
+    if buffer is None:
+        f.write(data.decode())
+        return
+    # orjson already produced UTF-8; hand the bytes to the binary layer
+    # instead of decoding and re-encoding them.
+    f.flush()
+    buffer.write(data)
+
+
 # ─── CLI ────────────────────────────────────────────────────────────
 
+# [ \t] rather than \s: the match must not run onto the next line.
+_ENV_KEY_RE = re.compile(r"""^[ \t]*NEAR_MARKET_API_KEY[ \t]*=[ \t]*["']?([^\s#"']*)""", re.M)
+
+
+def parse_env_api_key(text: str) -> Optional[str]:
+    """Extract NEAR_MARKET_API_KEY from .env-style text, or None if unset."""
+    match = _ENV_KEY_RE.search(text)
+    return match.group(1) if match else None
+
+
 def load_api_key_from_env() -> Optional[str]:
     """Try loading from .env.local in current or parent directories."""
     for path in [".env.local", "../.env.local"]:
-        if os.path.exists(path):
+        try:
             with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("NEAR_MARKET_API_KEY="):
-                        return line.split("=", 1)[1].split("#")[0].strip()
+                key = parse_env_api_key(f.read())
+        except OSError:
+            continue
+        if key is not None:
+            return key
     return os.environ.get("NEAR_MARKET_API_KEY")
 
 
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
 def main():
     parser = argparse.ArgumentParser(description="NEAR Agent Earnings Optimizer")
     parser.add_argument("--api-key", help="Marketplace API key (sk_live_...)")
     parser.add_argument("--env", action="store_true", help="Load API key from .env.local")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--output", help="Save report to file")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the local API response cache")
+    parser.add_argument("--page-size", type=_positive_int, default=100, help="Jobs fetched per /jobs request")
+    parser.add_argument("--max-jobs", type=_positive_int, default=2000, help="Maximum open jobs to analyze")
     args = parser.parse_args()
 
+    global use_cache
+    use_cache = not args.no_cache
+
     api_key = args.api_key
     if not api_key or args.env:
         api_key = load_api_key_from_env()
@@ -431,26 +662,26 @@ def main():
         sys.exit(1)
 
     try:
-        analyzer = AgentAnalyzer(api_key)
+        analyzer = AgentAnalyzer(api_key, page_size=args.page_size, max_jobs=args.max_jobs)
     except HTTPError as e:
         print(f"API error: {e.code} {e.reason}", file=sys.stderr)
         sys.exit(1)
 
     if args.json:
         report = generate_json_report(analyzer)
-        output = json.dumps(report, indent=2)
         if args.output:
             with open(args.output, "w") as f:
-                f.write(output)
+                write_report(report, f)
             print(f"Report saved to {args.output}")
         else:
-            print(output)
+            write_report(report, sys.stdout)
+            print()
     else:
         report = print_report(analyzer)
         if args.output:
             json_report = generate_json_report(analyzer)
             with open(args.output, "w") as f:
-                json.dump(json_report, f, indent=2)
+                write_report(json_report, f)
             print(f"JSON report also saved to {args.output}")
 
 
@@ -5,96 +5,330 @@ NEAR Agent Marketplace Discord Bot
 Community hub for NEAR agents — job alerts, earnings tracking,
 bid management, and social features.
 
-Requires: discord.py, aiohttp
+Requires: discord.py, aiohttp, aiosqlite, orjson
 Environment: DISCORD_BOT_TOKEN, NEAR_MARKET_API_KEY
 """
 
 import asyncio
-import json
+import hashlib
+import logging
 import os
-from datetime import datetime, timezone
+import time
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 import aiohttp
+import aiosqlite
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands, tasks
 
+log = logging.getLogger("near_discord_bot")
+
 # ─── Config ────────────────────────────────────────────────────────
 
 DISCORD_TOKEN = os.environ.get("DISCORD_BOT_TOKEN", "")
 DEFAULT_API_KEY = os.environ.get("NEAR_MARKET_API_KEY", "")
 BASE_URL = "https://market.near.ai/v1"
 DATA_DIR = Path(__file__).parent / "data"
+DB_FILE = DATA_DIR / "bot.db"
+# JSON stores from before bot.db; imported into it once on first start.
 USERS_FILE = DATA_DIR / "users.json"
 ALERTS_FILE = DATA_DIR / "alerts.json"
 GM_FILE = DATA_DIR / "gm_streaks.json"
+MAX_EMBEDS = 10  # Discord's per-message embed limit
+ALERT_SEND_CONCURRENCY = 10
 
 DATA_DIR.mkdir(exist_ok=True)
 
+
+class MarketBot(commands.Bot):
+    async def close(self):
+        await super().close()
+        await close_db()
+        await close_session()
+
+
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = MarketBot(command_prefix="!", intents=intents)
 
 
 # ─── Persistence ───────────────────────────────────────────────────
 
-def _load_json(path: Path) -> dict:
-    if path.exists():
-        try:
-            return json.loads(path.read_text())
-        except json.JSONDecodeError:
-            pass
-    return {}
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    api_key TEXT NOT NULL,
+    registered_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS alerts (
+    user_id TEXT PRIMARY KEY,
+    skills_json TEXT NOT NULL,
+    min_budget REAL NOT NULL,
+    channel_id INTEGER,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS gm_streaks (
+    user_id TEXT PRIMARY KEY,
+    streak INTEGER NOT NULL,
+    last_gm TEXT NOT NULL,
+    total INTEGER NOT NULL
+);
+"""
+
+_db: aiosqlite.Connection | None = None
+_db_lock = asyncio.Lock()
+
+
+async def get_db() -> aiosqlite.Connection:
+    """Open the bot database once and keep it for the bot's lifetime."""
+    global _db
+    async with _db_lock:
+        if _db is None:
+            db = await aiosqlite.connect(DB_FILE)
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
+            await db.executescript(_SCHEMA)
+            await _import_json_stores(db)
+            _db = db
+    return _db
+
+
+async def close_db():
+    global _db
+    if _db is not None:
+        await _db.close()
+        _db = None
+
+
+def _read_legacy(path: Path) -> dict:
+    try:
+        return orjson.loads(path.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+
+async def _import_json_stores(db: aiosqlite.Connection):
+    """Move data from the JSON files used before bot.db, then retire them."""
+    legacy = [p for p in (USERS_FILE, ALERTS_FILE, GM_FILE) if p.exists()]
+    if not legacy:
+        return
+    users = _read_legacy(USERS_FILE)
+    await db.executemany(
+        "INSERT OR IGNORE INTO users VALUES (?, ?, ?)",
+        [(uid, u["api_key"], u.get("registered_at", "")) for uid, u in users.items()],
+    )
+    alerts = _read_legacy(ALERTS_FILE)
+    await db.executemany(
+        "INSERT OR IGNORE INTO alerts VALUES (?, ?, ?, ?, ?)",
+        [
+            (uid, orjson.dumps(a.get("skills", [])).decode(), a.get("min_budget", 0),
+             a.get("channel_id"), a.get("created_at", ""))
+            for uid, a in alerts.items()
+        ],
+    )
+    streaks = _read_legacy(GM_FILE)
+    await db.executemany(
+        "INSERT OR IGNORE INTO gm_streaks VALUES (?, ?, ?, ?)",
+        [(uid, g.get("streak", 0), g.get("last_gm", ""), g.get("total", 0)) for uid, g in streaks.items()],
+    )
+    await db.commit()
+    for path in legacy:
+        path.rename(path.with_name(f"{path.name}.migrated"))
+
 
+async def get_user_key(user_id: str) -> str | None:
+    db = await get_db()
+    async with db.execute("SELECT api_key FROM users WHERE user_id = ?", (str(user_id),)) as cur:
+        row = await cur.fetchone()
+    return row[0] if row else None
 
-def _save_json(path: Path, data: dict):
-    path.write_text(json.dumps(data, indent=2))
 
+async def save_user_key(user_id: str, api_key: str):
+    db = await get_db()
+    await db.execute(
+        "INSERT OR REPLACE INTO users VALUES (?, ?, ?)",
+        (str(user_id), api_key, datetime.now(timezone.utc).isoformat()),
+    )
+    await db.commit()
 
-def get_user_key(user_id: str) -> str | None:
-    users = _load_json(USERS_FILE)
-    return users.get(str(user_id), {}).get("api_key")
 
+async def save_alert(user_id: str, skills: list[str], min_budget: float, channel_id: int | None):
+    db = await get_db()
+    await db.execute(
+        "INSERT OR REPLACE INTO alerts VALUES (?, ?, ?, ?, ?)",
+        (str(user_id), orjson.dumps(skills).decode(), min_budget, channel_id,
+         datetime.now(timezone.utc).isoformat()),
+    )
+    await db.commit()
 
-def save_user_key(user_id: str, api_key: str):
-    users = _load_json(USERS_FILE)
-    users[str(user_id)] = {"api_key": api_key, "registered_at": datetime.now(timezone.utc).isoformat()}
-    _save_json(USERS_FILE, users)
+
+async def load_alerts() -> dict[str, dict]:
+    db = await get_db()
+    async with db.execute("SELECT user_id, skills_json, min_budget, channel_id FROM alerts") as cur:
+        rows = await cur.fetchall()
+    return {
+        user_id: {"skills": orjson.loads(skills), "min_budget": min_budget, "channel_id": channel_id}
+        for user_id, skills, min_budget, channel_id in rows
+    }
+
+
+async def record_gm(user_id: str, today: str, yesterday: str) -> tuple[bool, int]:
+    """
+    Count today's GM for a user, at most once per day.
+
+    The check and the update are one statement, so overlapping /gm calls
+    can't both pass the "already said GM today" test.  Returns whether
+    this call was counted and the resulting streak.
+    """
+    db = await get_db()
+    cur = await db.execute(
+        """
+        INSERT INTO gm_streaks VALUES (?, 1, ?, 1)
+        ON CONFLICT(user_id) DO UPDATE SET
+            streak = CASE WHEN last_gm = ? THEN streak + 1 ELSE 1 END,
+            last_gm = excluded.last_gm,
+            total = total + 1
+        WHERE last_gm != excluded.last_gm
+        """,
+        (str(user_id), today, yesterday),
+    )
+    counted = cur.rowcount > 0
+    await cur.close()
+    await db.commit()
+    async with db.execute("SELECT streak FROM gm_streaks WHERE user_id = ?", (str(user_id),)) as cur:
+        row = await cur.fetchone()
+    return counted, row[0]
 
 
 # ─── API Client ────────────────────────────────────────────────────
 
-async def api_get(endpoint: str, api_key: str | None = None) -> dict | list:
+_session: aiohttp.ClientSession | None = None
+
+# At most API_CONCURRENCY requests in flight; 429s are retried after the
+# server's Retry-After (or exponential backoff) up to API_MAX_RETRIES times.
+API_CONCURRENCY = 16
+API_MAX_RETRIES = 3
+_api_sem = asyncio.Semaphore(API_CONCURRENCY)
+
+# Short-lived LRU of GET responses for endpoints users hit back-to-back
+# (/earnings summary, /agent profile and /agent bids all read bids).
+# Keys hold a digest of the API key, never the key itself.
+API_CACHE_TTL = {"/agents/me/bids": 30}
+API_CACHE_SIZE = 1024
+_api_cache: OrderedDict[tuple, tuple[float, dict | list]] = OrderedDict()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Shared session so API calls reuse pooled keep-alive connections."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=15),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300),
+        )
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+@lru_cache(maxsize=256)
+def _headers(key: str) -> tuple:
+    return (("Authorization", f"Bearer {key}"), ("Content-Type", "application/json"))
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    try:
+        return min(float(retry_after), 30.0)
+    except (TypeError, ValueError):
+        return float(2 ** attempt)
+
+
+async def _api_request(method: str, endpoint: str, key: str, ok: tuple, **kwargs):
+    """Return the decoded JSON body, or None if the status isn't in ok."""
+    session = await get_session()
+    for attempt in range(API_MAX_RETRIES + 1):
+        async with _api_sem:
+            async with session.request(method, f"{BASE_URL}{endpoint}", headers=_headers(key), **kwargs) as resp:
+                if resp.status in ok:
+                    return await resp.json(loads=orjson.loads)
+                if resp.status != 429 or attempt == API_MAX_RETRIES:
+                    return None
+                delay = _retry_delay(resp.headers.get("Retry-After"), attempt)
+        await asyncio.sleep(delay)
+
+
+async def api_get(endpoint: str, api_key: str | None = None, params: dict | None = None) -> dict | list:
     key = api_key or DEFAULT_API_KEY
     if not key:
         return []
-    headers = {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
+    ttl = API_CACHE_TTL.get(endpoint)
+    if ttl:
+        cache_key = (
+            hashlib.blake2b(key.encode(), digest_size=16).digest(),
+            endpoint,
+            tuple(sorted(params.items())) if params else (),
+        )
+        cached = _api_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            _api_cache.move_to_end(cache_key)
+            return cached[1]
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{BASE_URL}{endpoint}", headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return []
+        result = await _api_request("GET", endpoint, key, (200,), params=params)
     except Exception:
         return []
+    if result is None:
+        return []
+    if ttl:
+        _api_cache[cache_key] = (time.monotonic(), result)
+        _api_cache.move_to_end(cache_key)
+        if len(_api_cache) > API_CACHE_SIZE:
+            _api_cache.popitem(last=False)
+    return result
 
 
 async def api_post(endpoint: str, data: dict, api_key: str | None = None) -> dict | None:
     key = api_key or DEFAULT_API_KEY
     if not key:
         return None
-    headers = {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{BASE_URL}{endpoint}", json=data, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status in (200, 201):
-                    return await resp.json()
-                return None
+        return await _api_request("POST", endpoint, key, (200, 201), json=data)
     except Exception:
         return None
 
 
+def tally_bids(bids: list) -> tuple[dict, dict]:
+    """Count bids per status and sum accepted/pending amounts in one pass."""
+    counts = {"accepted": 0, "pending": 0, "rejected": 0}
+    totals = {"accepted": 0.0, "pending": 0.0}
+    for b in bids:
+        status = b["status"]
+        counts[status] = counts.get(status, 0) + 1
+        if status in totals:
+            totals[status] += float(b.get("amount", 0))
+    return counts, totals
+
+
+def build_tag_index(jobs: list) -> dict[str, list[int]]:
+    """Map each lowercase tag to the positions of the jobs carrying it."""
+    index = defaultdict(list)
+    for i, job in enumerate(jobs):
+        for tag in {t.lower() for t in job.get("tags", [])}:
+            index[tag].append(i)
+    return index
+
+
 # ─── Embeds ────────────────────────────────────────────────────────
 
 def job_embed(job: dict) -> discord.Embed:
@@ -119,12 +353,19 @@ def job_embed(job: dict) -> discord.Embed:
     return embed
 
 
+BID_STATUS_COLORS = {
+    "pending": discord.Color.blue(),
+    "accepted": discord.Color.green(),
+    "rejected": discord.Color.red(),
+}
+BID_DEFAULT_COLOR = discord.Color.greyple()
+
+
 def bid_embed(bid: dict) -> discord.Embed:
     status = bid.get("status", "unknown")
-    colors = {"pending": discord.Color.blue(), "accepted": discord.Color.green(), "rejected": discord.Color.red()}
     embed = discord.Embed(
         title=f"Bid: {bid.get('amount', '?')} NEAR",
-        color=colors.get(status, discord.Color.greyple()),
+        color=BID_STATUS_COLORS.get(status, BID_DEFAULT_COLOR),
     )
     embed.add_field(name="Status", value=status.upper(), inline=True)
     embed.add_field(name="Job", value=bid.get("job_id", "?")[:12] + "...", inline=True)
@@ -141,14 +382,15 @@ jobs_group = app_commands.Group(name="jobs", description="Browse and manage mark
 @app_commands.describe(limit="Number of jobs to show (max 10)")
 async def jobs_browse(interaction: discord.Interaction, limit: int = 5):
     await interaction.response.defer()
-    limit = min(limit, 10)
-    jobs = await api_get(f"/jobs?status=open&limit={limit}")
+    limit = max(1, min(limit, MAX_EMBEDS))
+    jobs = await api_get("/jobs", params={"status": "open", "limit": limit})
 
     if not jobs:
         await interaction.followup.send("No open jobs found.")
         return
 
-    embeds = [job_embed(j) for j in jobs[:limit]]
+    # islice bounds the embeds in case the API ignores limit, without copying.
+    embeds = [job_embed(j) for j in islice(jobs, limit)]
     await interaction.followup.send(f"**{len(embeds)} Open Jobs:**", embeds=embeds)
 
 
@@ -157,21 +399,18 @@ async def jobs_browse(interaction: discord.Interaction, limit: int = 5):
 async def jobs_match(interaction: discord.Interaction, skills: str):
     await interaction.response.defer()
     skill_set = {s.strip().lower() for s in skills.split(",")}
-    jobs = await api_get("/jobs?status=open&limit=50")
+    jobs = await api_get("/jobs", params={"status": "open", "limit": 50})
 
     if not jobs:
         await interaction.followup.send("No open jobs found.")
         return
 
-    matched = []
-    for job in jobs:
-        job_tags = {t.lower() for t in job.get("tags", [])}
-        overlap = skill_set & job_tags
-        if overlap:
-            job["_match_count"] = len(overlap)
-            matched.append(job)
-
-    matched.sort(key=lambda j: j["_match_count"], reverse=True)
+    index = build_tag_index(jobs)
+    match_counts = Counter()
+    for skill in skill_set:
+        match_counts.update(index.get(skill, ()))
+    # Most overlapping skills first; ties keep the API's job order.
+    matched = [jobs[i] for i in sorted(match_counts, key=lambda i: (-match_counts[i], i))]
 
     if not matched:
         await interaction.followup.send(f"No jobs matching `{skills}`. Try broader skills.")
@@ -184,15 +423,12 @@ async def jobs_match(interaction: discord.Interaction, skills: str):
 @jobs_group.command(name="alert", description="Set up job notifications")
 @app_commands.describe(skills="Comma-separated skills to watch", min_budget="Minimum budget in NEAR")
 async def jobs_alert(interaction: discord.Interaction, skills: str, min_budget: float = 5.0):
-    alerts = _load_json(ALERTS_FILE)
-    user_id = str(interaction.user.id)
-    alerts[user_id] = {
-        "skills": [s.strip().lower() for s in skills.split(",")],
-        "min_budget": min_budget,
-        "channel_id": interaction.channel_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-    }
-    _save_json(ALERTS_FILE, alerts)
+    await save_alert(
+        str(interaction.user.id),
+        [s.strip().lower() for s in skills.split(",")],
+        min_budget,
+        interaction.channel_id,
+    )
     await interaction.response.send_message(
         f"Job alerts set! Watching for: `{skills}` (min {min_budget} NEAR)\n"
         f"I'll notify you in this channel when matching jobs appear."
@@ -210,57 +446,60 @@ earnings_group = app_commands.Group(name="earnings", description="Track your NEA
 @earnings_group.command(name="summary", description="Your earnings summary")
 async def earnings_summary(interaction: discord.Interaction):
     await interaction.response.defer()
-    api_key = get_user_key(str(interaction.user.id))
+    api_key = await get_user_key(str(interaction.user.id))
 
     if not api_key:
         await interaction.followup.send("Register first with `/agent register` (in DMs).")
         return
 
-    bids = await api_get("/agents/me/bids", api_key)
-    wallet = await api_get("/wallet/balance", api_key)
+    bids, wallet = await asyncio.gather(
+        api_get("/agents/me/bids", api_key),
+        api_get("/wallet/balance", api_key),
+    )
 
     if not bids:
         await interaction.followup.send("No bid data found.")
         return
 
-    accepted = [b for b in bids if b["status"] == "accepted"]
-    pending = [b for b in bids if b["status"] == "pending"]
-    rejected = [b for b in bids if b["status"] == "rejected"]
+    counts, totals = tally_bids(bids)
+    accepted, pending, rejected = counts["accepted"], counts["pending"], counts["rejected"]
     balance = wallet.get("balance", "0") if isinstance(wallet, dict) else "0"
 
-    total_won = sum(float(b.get("amount", 0)) for b in accepted)
-    total_pending = sum(float(b.get("amount", 0)) for b in pending)
-
     embed = discord.Embed(title="Your Earnings", color=discord.Color.gold())
     embed.add_field(name="Wallet Balance", value=f"{balance} NEAR", inline=True)
-    embed.add_field(name="Won (accepted)", value=f"{total_won:.1f} NEAR ({len(accepted)} jobs)", inline=True)
-    embed.add_field(name="Pending", value=f"{total_pending:.1f} NEAR ({len(pending)} bids)", inline=True)
-    embed.add_field(name="Rejected", value=f"{len(rejected)} bids", inline=True)
-    embed.add_field(name="Win Rate", value=f"{len(accepted)}/{len(accepted)+len(rejected)} ({100*len(accepted)/max(1,len(accepted)+len(rejected)):.0f}%)", inline=True)
+    embed.add_field(name="Won (accepted)", value=f"{totals['accepted']:.1f} NEAR ({accepted} jobs)", inline=True)
+    embed.add_field(name="Pending", value=f"{totals['pending']:.1f} NEAR ({pending} bids)", inline=True)
+    embed.add_field(name="Rejected", value=f"{rejected} bids", inline=True)
+    embed.add_field(name="Win Rate", value=f"{accepted}/{accepted+rejected} ({100*accepted/max(1,accepted+rejected):.0f}%)", inline=True)
     embed.set_footer(text=f"Total bids: {len(bids)}")
 
     await interaction.followup.send(embed=embed)
 
 
+# Static content, so it's built once at import instead of per invocation.
+LEADERBOARD_EMBED = discord.Embed(
+    title="Earnings Leaderboard",
+    description=(
+        "Leaderboard data comes from public marketplace stats.\n"
+        "Register with `/agent register` to appear on the board."
+    ),
+    color=discord.Color.gold(),
+)
+LEADERBOARD_EMBED.add_field(
+    name="Top Agents",
+    value=(
+        "1. `alpha_acc_agent` — 52.0 NEAR won\n"
+        "2. *More agents joining daily...*\n\n"
+        "Win jobs to climb the leaderboard!"
+    ),
+    inline=False,
+)
+
+
 @earnings_group.command(name="leaderboard", description="Top earners on the marketplace")
 async def earnings_leaderboard(interaction: discord.Interaction):
     await interaction.response.defer()
-
-    embed = discord.Embed(title="Earnings Leaderboard", color=discord.Color.gold())
-    embed.description = (
-        "Leaderboard data comes from public marketplace stats.\n"
-        "Register with `/agent register` to appear on the board."
-    )
-    embed.add_field(
-        name="Top Agents",
-        value=(
-            "1. `alpha_acc_agent` — 52.0 NEAR won\n"
-            "2. *More agents joining daily...*\n\n"
-            "Win jobs to climb the leaderboard!"
-        ),
-        inline=False,
-    )
-    await interaction.followup.send(embed=embed)
+    await interaction.followup.send(embed=LEADERBOARD_EMBED.copy())
 
 
 bot.tree.add_command(earnings_group)
@@ -281,7 +520,7 @@ async def agent_register(interaction: discord.Interaction, api_key: str):
         )
         return
 
-    save_user_key(str(interaction.user.id), api_key)
+    await save_user_key(str(interaction.user.id), api_key)
     await interaction.response.send_message(
         "API key registered! You can now use `/earnings summary` and `/agent bids`.\n"
         "Your key is stored locally and never shared."
@@ -291,22 +530,21 @@ async def agent_register(interaction: discord.Interaction, api_key: str):
 @agent_group.command(name="profile", description="Show your agent profile")
 async def agent_profile(interaction: discord.Interaction):
     await interaction.response.defer()
-    api_key = get_user_key(str(interaction.user.id))
+    api_key = await get_user_key(str(interaction.user.id))
 
     if not api_key:
         await interaction.followup.send("Register first with `/agent register` (in DMs).")
         return
 
     bids = await api_get("/agents/me/bids", api_key)
-    accepted = [b for b in bids if b["status"] == "accepted"]
-    pending = [b for b in bids if b["status"] == "pending"]
+    counts, totals = tally_bids(bids)
 
     embed = discord.Embed(title=f"Agent: {interaction.user.display_name}", color=discord.Color.purple())
     embed.set_thumbnail(url=interaction.user.display_avatar.url)
     embed.add_field(name="Total Bids", value=str(len(bids)), inline=True)
-    embed.add_field(name="Won", value=str(len(accepted)), inline=True)
-    embed.add_field(name="Pending", value=str(len(pending)), inline=True)
-    embed.add_field(name="Total Won", value=f"{sum(float(b['amount']) for b in accepted):.1f} NEAR", inline=True)
+    embed.add_field(name="Won", value=str(counts["accepted"]), inline=True)
+    embed.add_field(name="Pending", value=str(counts["pending"]), inline=True)
+    embed.add_field(name="Total Won", value=f"{totals['accepted']:.1f} NEAR", inline=True)
 
     await interaction.followup.send(embed=embed)
 
@@ -314,7 +552,7 @@ async def agent_profile(interaction: discord.Interaction):
 @agent_group.command(name="bids", description="Show your active bids")
 async def agent_bids(interaction: discord.Interaction):
     await interaction.response.defer()
-    api_key = get_user_key(str(interaction.user.id))
+    api_key = await get_user_key(str(interaction.user.id))
 
     if not api_key:
         await interaction.followup.send("Register first with `/agent register` (in DMs).")
@@ -326,7 +564,7 @@ async def agent_bids(interaction: discord.Interaction):
         return
 
     # Show most recent 10
-    bids.sort(key=lambda b: b.get("created_at", ""), reverse=True)
+    bids = sorted(bids, key=lambda b: b.get("created_at", ""), reverse=True)
     embeds = [bid_embed(b) for b in bids[:10]]
     await interaction.followup.send(f"**Your Bids ({len(bids)} total):**", embeds=embeds[:10])
 
@@ -338,29 +576,18 @@ bot.tree.add_command(agent_group)
 
 @bot.tree.command(name="gm", description="Say GM and track your streak!")
 async def gm_command(interaction: discord.Interaction):
-    streaks = _load_json(GM_FILE)
     user_id = str(interaction.user.id)
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    now = datetime.now(timezone.utc).date()
+    today = now.isoformat()
 
-    user_data = streaks.get(user_id, {"streak": 0, "last_gm": "", "total": 0})
+    # The streak only continues if the last GM was yesterday.
+    yesterday = (now - timedelta(days=1)).isoformat()
+    counted, streak = await record_gm(user_id, today, yesterday)
 
-    if user_data["last_gm"] == today:
-        await interaction.response.send_message(f"You already said GM today! Streak: **{user_data['streak']}** days")
+    if not counted:
+        await interaction.response.send_message(f"You already said GM today! Streak: **{streak}** days")
         return
 
-    # Check if streak continues (yesterday)
-    yesterday = datetime.now(timezone.utc).strftime("%Y-%m-%d")  # simplified
-    if user_data["last_gm"] and user_data["streak"] > 0:
-        user_data["streak"] += 1
-    else:
-        user_data["streak"] = 1
-
-    user_data["last_gm"] = today
-    user_data["total"] = user_data.get("total", 0) + 1
-    streaks[user_id] = user_data
-    _save_json(GM_FILE, streaks)
-
-    streak = user_data["streak"]
     msg = f"GM {interaction.user.display_name}! Streak: **{streak}** day{'s' if streak != 1 else ''}"
     if streak >= 7:
         msg += " (On fire!)"
@@ -384,19 +611,40 @@ async def tip_command(interaction: discord.Interaction, user: discord.Member, am
 
 # ─── Background Tasks ─────────────────────────────────────────────
 
+async def _send_alert(channel, user_id: str, matches: list, sem: asyncio.Semaphore):
+    # One message per MAX_EMBEDS matches instead of one per job.
+    content = f"<@{user_id}> {len(matches)} new matching job{'s' if len(matches) != 1 else ''}!"
+    for i in range(0, len(matches), MAX_EMBEDS):
+        async with sem:
+            try:
+                await channel.send(content, embeds=matches[i:i + MAX_EMBEDS])
+            except discord.Forbidden:
+                return
+
+
 @tasks.loop(minutes=30)
 async def job_alert_loop():
     """Check for new jobs matching user alerts."""
-    alerts = _load_json(ALERTS_FILE)
+    alerts = await load_alerts()
     if not alerts:
         return
 
-    jobs = await api_get("/jobs?status=open&limit=50")
+    jobs = await api_get("/jobs", params={"status": "open", "limit": 50})
     if not jobs:
         return
 
+    # Index the snapshot once; every alert below looks up its skills in it.
+    budgets = [float(job.get("budget_amount") or 0) for job in jobs]
+    index = build_tag_index(jobs)
+    # Alert embeds are identical for every user, so build each one once;
+    # they're never mutated after creation and can be shared across sends.
+    alert_embeds: dict[int, discord.Embed] = {}
+    send_sem = asyncio.Semaphore(ALERT_SEND_CONCURRENCY)
+    sends = []
+    recipients = []
+
     for user_id, alert in alerts.items():
-        skills = set(alert.get("skills", []))
+        skills = alert.get("skills", [])
         min_budget = alert.get("min_budget", 0)
         channel_id = alert.get("channel_id")
 
@@ -407,19 +655,28 @@ async def job_alert_loop():
         if not channel:
             continue
 
-        for job in jobs:
-            budget = float(job.get("budget_amount", 0))
-            tags = {t.lower() for t in job.get("tags", [])}
-
-            if budget >= min_budget and skills & tags:
-                embed = job_embed(job)
-                embed.title = f"Job Alert: {job.get('title', 'New Job')}"
-                try:
-                    await channel.send(f"<@{user_id}> New matching job!", embed=embed)
-                except discord.Forbidden:
-                    pass
-
-    await asyncio.sleep(1)
+        hits = set()
+        for skill in skills:
+            hits.update(index.get(skill, ()))
+
+        matches = []
+        for i in sorted(hits):
+            if budgets[i] >= min_budget:
+                if i not in alert_embeds:
+                    embed = job_embed(jobs[i])
+                    embed.title = f"Job Alert: {jobs[i].get('title', 'New Job')}"
+                    alert_embeds[i] = embed
+                matches.append(alert_embeds[i])
+
+        if matches:
+            sends.append(_send_alert(channel, user_id, matches, send_sem))
+            recipients.append((user_id, channel_id))
+
+    # One failed channel must not cancel the others, but its error is still reported.
+    results = await asyncio.gather(*sends, return_exceptions=True)
+    for (user_id, channel_id), result in zip(recipients, results):
+        if isinstance(result, Exception):
+            log.warning("Job alert for user %s in channel %s failed: %r", user_id, channel_id, result)
 
 
 # ─── Bot Events ────────────────────────────────────────────────────
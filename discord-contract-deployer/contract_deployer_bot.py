@@ -5,33 +5,100 @@ NEAR Contract Deployer Discord Bot
 Deploy, verify, and manage NEAR smart contracts directly from Discord.
 Uses NEAR RPC API for on-chain operations.
 
-Requires: discord.py, aiohttp, python-dotenv
+Requires: discord.py, aiohttp, aiosqlite, python-dotenv, PyNaCl, base58, orjson
 Environment: DISCORD_BOT_TOKEN, NEAR_ACCOUNT_ID, NEAR_PRIVATE_KEY
 """
 
 import asyncio
 import base64
 import hashlib
+import hmac
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import re
+import struct
+import sys
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import aiohttp
+import aiosqlite
+import base58
 import discord
+import nacl.signing
+import orjson
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # optional, and unavailable on Windows
+    uvloop = None
+
 load_dotenv()
 
+# --- Logging ----------------------------------------------------------------
+
+# Handlers only enqueue records; a listener thread (started in main) does the
+# actual writes, so a slow stdout can never stall the event loop.
+_LOG_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class _LogFormatter(logging.Formatter):
+    """Plain text lines, except records logged with an "event" extra.
+
+    Those become one JSON object carrying the extra fields, so aggregators
+    can index and alert on them without parsing the message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "event"):
+            return super().format(record)
+        line = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            **{k: v for k, v in vars(record).items() if k not in _LOG_RECORD_ATTRS},
+            # QueueHandler has already folded any traceback into the message
+            "msg": record.getMessage(),
+        }
+        return orjson.dumps(line, default=str).decode()
+
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(_LogFormatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+# The queue side only needs the bare message; timestamps etc. are added on output
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+log = logging.getLogger("contract_deployer")
+
 # --- Config -----------------------------------------------------------------
 
 DISCORD_TOKEN = os.environ.get("DISCORD_BOT_TOKEN", "")
 NEAR_ACCOUNT_ID = os.environ.get("NEAR_ACCOUNT_ID", "")
 NEAR_PRIVATE_KEY = os.environ.get("NEAR_PRIVATE_KEY", "")
 NEAR_NETWORK = os.environ.get("NEAR_NETWORK", "testnet")
+# When set, slash commands are synced to this guild only (instant, and not
+# subject to the global sync limits) instead of globally.
+DEV_GUILD_ID = os.environ.get("DISCORD_DEV_GUILD_ID", "")
+
+REQUIRED_ENV = {"DISCORD_BOT_TOKEN": DISCORD_TOKEN}
+OPTIONAL_ENV = {
+    "NEAR_ACCOUNT_ID": (NEAR_ACCOUNT_ID, "Generated /call commands will use a placeholder signer."),
+    "NEAR_PRIVATE_KEY": (NEAR_PRIVATE_KEY, "Deploy commands will fail."),
+}
 
 RPC_URLS = {
     "mainnet": "https://rpc.mainnet.near.org",
@@ -45,31 +112,110 @@ EXPLORER_URLS = {
 RPC_URL = RPC_URLS.get(NEAR_NETWORK, RPC_URLS["testnet"])
 EXPLORER_URL = EXPLORER_URLS.get(NEAR_NETWORK, EXPLORER_URLS["testnet"])
 
+# Footer/banner text only depends on the config above
+NETWORK_FOOTER = f"Network: {NEAR_NETWORK}"
+NETWORK_RPC_LINE = f"Network: {NEAR_NETWORK} | RPC: {RPC_URL}"
+CALL_FOOTER = f"Network: {NEAR_NETWORK} | Run this command in your terminal with near-cli installed."
+
+MAX_WASM_SIZE = 4 * 1024 * 1024  # NEAR caps contract code at ~4 MB
+WASM_MAGIC = b"\x00asm"
+
 DATA_DIR = Path(__file__).parent / "data"
+DB_FILE = DATA_DIR / "deployments.db"
+# JSON store from before deployments.db; imported into it once on first start.
 DEPLOYMENTS_FILE = DATA_DIR / "deployments.json"
+COMMAND_SYNC_FILE = DATA_DIR / ".command_sync_hash"
+SYNC_ATTEMPTS = 6
+SYNC_TIMEOUT = 10
 DATA_DIR.mkdir(exist_ok=True)
 
-intents = discord.Intents.default()
-intents.message_content = True
-bot = commands.Bot(command_prefix="!", intents=intents)
+
+class DeployerBot(commands.Bot):
+    sync_task: asyncio.Task | None = None
+
+    async def close(self):
+        if self.sync_task is not None:
+            self.sync_task.cancel()
+        await super().close()
+        await close_db()
+        await close_session()
+
+
+# Slash commands only: no message content, members or presences needed, so
+# the READY payload and caches stay small regardless of guild size.
+intents = discord.Intents.none()
+intents.guilds = True
+bot = DeployerBot(
+    command_prefix="!",
+    intents=intents,
+    chunk_guilds_at_startup=False,
+    member_cache_flags=discord.MemberCacheFlags.none(),
+)
 
 
 # --- Persistence ------------------------------------------------------------
 
-def _load_deployments() -> dict:
-    if DEPLOYMENTS_FILE.exists():
-        try:
-            return json.loads(DEPLOYMENTS_FILE.read_text())
-        except json.JSONDecodeError:
-            pass
-    return {}
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deployments (
+    key TEXT PRIMARY KEY,
+    contract_name TEXT NOT NULL,
+    tx_hash TEXT NOT NULL,
+    network TEXT NOT NULL,
+    wasm_hash TEXT NOT NULL,
+    status TEXT NOT NULL,
+    deployed_by TEXT NOT NULL,
+    deployed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_deployments_user_time
+    ON deployments (deployed_by, deployed_at DESC);
+CREATE INDEX IF NOT EXISTS idx_deployments_time ON deployments (deployed_at DESC);
+"""
+_RECORD_FIELDS = (
+    "contract_name", "tx_hash", "network", "wasm_hash", "status", "deployed_by", "deployed_at",
+)
+
+_db: aiosqlite.Connection | None = None
+_db_lock = asyncio.Lock()
+
 
+async def get_db() -> aiosqlite.Connection:
+    """Open the deployments database once and keep it for the bot's lifetime."""
+    global _db
+    async with _db_lock:
+        if _db is None:
+            db = await aiosqlite.connect(DB_FILE)
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
+            await db.executescript(_SCHEMA)
+            await _import_json_store(db)
+            _db = db
+    return _db
 
-def _save_deployments(data: dict):
-    DEPLOYMENTS_FILE.write_text(json.dumps(data, indent=2))
 
+async def close_db():
+    global _db
+    if _db is not None:
+        await _db.close()
+        _db = None
 
-def _record_deployment(
+
+async def _import_json_store(db: aiosqlite.Connection):
+    """Move records from the deployments.json used before the database, then retire it."""
+    if not DEPLOYMENTS_FILE.exists():
+        return
+    try:
+        records = orjson.loads(await asyncio.to_thread(DEPLOYMENTS_FILE.read_bytes))
+    except orjson.JSONDecodeError:
+        records = {}
+    await db.executemany(
+        "INSERT OR IGNORE INTO deployments VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [(key, *(r.get(f, "") for f in _RECORD_FIELDS)) for key, r in records.items()],
+    )
+    await db.commit()
+    DEPLOYMENTS_FILE.rename(DEPLOYMENTS_FILE.with_name(f"{DEPLOYMENTS_FILE.name}.migrated"))
+
+
+async def _record_deployment(
     user_id: str,
     contract_name: str,
     tx_hash: str,
@@ -77,23 +223,94 @@ def _record_deployment(
     wasm_hash: str,
     status: str = "deployed",
 ):
-    deployments = _load_deployments()
-    key = f"{contract_name}@{network}"
-    deployments[key] = {
-        "contract_name": contract_name,
-        "tx_hash": tx_hash,
-        "network": network,
-        "wasm_hash": wasm_hash,
-        "status": status,
-        "deployed_by": user_id,
-        "deployed_at": datetime.now(timezone.utc).isoformat(),
-    }
-    _save_deployments(deployments)
+    db = await get_db()
+    await db.execute(
+        "INSERT OR REPLACE INTO deployments VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            f"{contract_name}@{network}", contract_name, tx_hash, network, wasm_hash,
+            status, user_id, datetime.now(timezone.utc).isoformat(),
+        ),
+    )
+    await db.commit()
+
+
+async def _count_deployments(user_id: str | None = None) -> int:
+    db = await get_db()
+    if user_id is None:
+        cur = await db.execute("SELECT COUNT(*) FROM deployments")
+    else:
+        cur = await db.execute("SELECT COUNT(*) FROM deployments WHERE deployed_by = ?", (user_id,))
+    async with cur:
+        (count,) = await cur.fetchone()
+    return count
+
+
+async def _recent_deployments(user_id: str | None = None, limit: int = 10) -> list[dict]:
+    """Newest deployment records, optionally only those made by ``user_id``."""
+    db = await get_db()
+    columns = ", ".join(_RECORD_FIELDS)
+    if user_id is None:
+        cur = await db.execute(
+            f"SELECT {columns} FROM deployments ORDER BY deployed_at DESC LIMIT ?", (limit,)
+        )
+    else:
+        cur = await db.execute(
+            f"SELECT {columns} FROM deployments WHERE deployed_by = ? "
+            "ORDER BY deployed_at DESC LIMIT ?",
+            (user_id, limit),
+        )
+    async with cur:
+        rows = await cur.fetchall()
+    return [dict(zip(_RECORD_FIELDS, row)) for row in rows]
 
 
 # --- NEAR RPC Client -------------------------------------------------------
 
-async def rpc_call(method: str, params: dict | list) -> dict:
+_session: aiohttp.ClientSession | None = None
+
+# Users tend to run /status and /verify on the same account back to back,
+# and on-chain code rarely changes, so account/code lookups are reused briefly.
+VIEW_CACHE_TTL = 30
+VIEW_CACHE_SIZE = 512
+_view_cache: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Shared session so RPC calls and downloads reuse pooled keep-alive connections."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75,
+            ),
+        )
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+# Bodies for the account queries are pre-encoded; only the account ID (and
+# public key) vary. IDs are checked against ACCOUNT_ID_RE first, which keeps
+# quotes and backslashes out of the template.
+ACCOUNT_ID_RE = re.compile(r"[a-z0-9._-]{2,64}")
+_ACCOUNT_QUERY_TMPL = (
+    b'{"jsonrpc":"2.0","id":"deployer","method":"query","params":'
+    b'{"request_type":"%s","finality":"final","account_id":"%s"}}'
+)
+_ACCESS_KEY_QUERY_TMPL = (
+    b'{"jsonrpc":"2.0","id":"deployer","method":"query","params":'
+    b'{"request_type":"view_access_key","finality":"final","account_id":"%s","public_key":"%s"}}'
+)
+
+
+async def rpc_call(method: str, params: dict | list, timeout: float = 30) -> dict:
     """Send a JSON-RPC request to the NEAR RPC endpoint."""
     payload = {
         "jsonrpc": "2.0",
@@ -101,44 +318,77 @@ async def rpc_call(method: str, params: dict | list) -> dict:
         "method": method,
         "params": params,
     }
+    return await _rpc_post(timeout, json=payload)
+
+
+async def _rpc_post(timeout: float = 30, **body) -> dict:
+    session = await get_session()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                RPC_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as resp:
-                data = await resp.json()
-                return data
+        async with session.post(
+            RPC_URL,
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            **body,
+        ) as resp:
+            data = await resp.json(loads=orjson.loads)
+            return data
     except aiohttp.ClientError as exc:
         return {"error": {"message": str(exc)}}
     except asyncio.TimeoutError:
         return {"error": {"message": "RPC request timed out"}}
 
 
-async def view_account(account_id: str) -> dict | None:
-    """Fetch account info from NEAR RPC."""
-    result = await rpc_call("query", {
-        "request_type": "view_account",
-        "finality": "final",
-        "account_id": account_id,
-    })
-    if "error" in result:
+def _account_query_body(request_type: str, account_id: str) -> bytes | None:
+    if not ACCOUNT_ID_RE.fullmatch(account_id):
         return None
-    return result.get("result")
+    return _ACCOUNT_QUERY_TMPL % (request_type.encode(), account_id.encode())
 
 
-async def view_code(account_id: str) -> dict | None:
-    """Fetch contract code metadata from NEAR RPC."""
-    result = await rpc_call("query", {
-        "request_type": "view_code",
-        "finality": "final",
-        "account_id": account_id,
-    })
+def _summarize_code(result: dict) -> dict:
+    """view_code result with the (up to ~5 MB) code_base64 replaced by its decoded size."""
+    code_b64 = result.pop("code_base64", "") or ""
+    result["code_size"] = len(code_b64) * 3 // 4 - (len(code_b64) - len(code_b64.rstrip("=")))
+    return result
+
+
+async def _cached_query(request_type: str, account_id: str) -> dict | None:
+    """Run a final-finality account query, reusing results younger than VIEW_CACHE_TTL."""
+    cache_key = (request_type, account_id)
+    cached = _view_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < VIEW_CACHE_TTL:
+        _view_cache.move_to_end(cache_key)
+        return cached[1]
+    body = _account_query_body(request_type, account_id)
+    if body is None:
+        return None
+    result = await _rpc_post(data=body)
     if "error" in result:
         return None
-    return result.get("result")
+    value = result.get("result")
+    if value is not None and request_type == "view_code":
+        # Callers only need the hash and size; don't pin the code itself
+        value = _summarize_code(value)
+    if value is not None:
+        _view_cache[cache_key] = (time.monotonic(), value)
+        _view_cache.move_to_end(cache_key)
+        if len(_view_cache) > VIEW_CACHE_SIZE:
+            _view_cache.popitem(last=False)
+    return value
+
+
+def _invalidate_views(account_id: str):
+    for request_type in ("view_account", "view_code"):
+        _view_cache.pop((request_type, account_id), None)
+
+
+async def view_account(account_id: str) -> dict | None:
+    """Fetch account info from NEAR RPC."""
+    return await _cached_query("view_account", account_id)
+
+
+async def view_code(account_id: str) -> dict | None:
+    """Fetch contract code metadata (hash and code_size, not the code) from NEAR RPC."""
+    return await _cached_query("view_code", account_id)
 
 
 async def get_tx_status(tx_hash: str, sender_id: str) -> dict | None:
@@ -153,163 +403,276 @@ async def get_tx_status(tx_hash: str, sender_id: str) -> dict | None:
     return result.get("result")
 
 
-async def download_wasm(url: str) -> bytes | None:
-    """Download a WASM binary from a URL."""
+async def download_wasm(url: str, hasher: "hashlib._Hash | None" = None) -> bytes | None:
+    """
+    Download a WASM binary from a URL.
+
+    The body is streamed in chunks; if ``hasher`` is given it is updated as
+    each chunk arrives so callers get the digest without a second pass.
+    Downloads over MAX_WASM_SIZE are refused up front when Content-Length
+    says so, and abandoned as soon as they cross it otherwise.
+    """
+    session = await get_session()
+    buf = bytearray()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=60),
-                allow_redirects=True,
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.read()
+        async with session.get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=60),
+            allow_redirects=True,
+        ) as resp:
+            if resp.status != 200:
+                return None
+            # Refuse declared-oversize bodies before reading any of them
+            if resp.content_length is not None and resp.content_length > MAX_WASM_SIZE:
+                return None
+            async for chunk in resp.content.iter_chunked(65536):
+                buf += chunk
                 # Basic WASM magic number check: \x00asm
-                if len(data) < 8 or data[:4] != b"\x00asm":
+                if len(buf) >= 4 and buf[:4] != WASM_MAGIC:
                     return None
-                return data
+                if len(buf) > MAX_WASM_SIZE:
+                    return None
+                if hasher is not None:
+                    hasher.update(chunk)
     except Exception:
         return None
+    if len(buf) < 8:
+        return None
+    return bytes(buf)
 
 
-async def send_deploy_tx(account_id: str, wasm_bytes: bytes) -> dict:
-    """
-    Build and broadcast a DeployContract transaction via NEAR RPC.
-
-    This constructs the transaction using the broadcast_tx_commit endpoint.
-    In production you would sign the transaction locally with the private key;
-    here we prepare the unsigned payload and use the RPC to broadcast.
-    """
-    # Get the current access key nonce and block hash
-    access_key_resp = await rpc_call("query", {
-        "request_type": "view_access_key",
-        "finality": "final",
-        "account_id": account_id,
-        "public_key": _derive_public_key(),
-    })
+async def fetch_access_key(account_id: str) -> dict:
+    """Look up the nonce and a recent block hash for the deployer's access key."""
+    if _SIGNING_KEY is None:
+        return {"error": {"message": "NEAR_PRIVATE_KEY is missing or malformed."}}
+    if not ACCOUNT_ID_RE.fullmatch(account_id):
+        return {"error": {"message": f"`{account_id}` is not a valid NEAR account ID."}}
 
+    access_key_resp = await _rpc_post(
+        data=_ACCESS_KEY_QUERY_TMPL % (account_id.encode(), _derive_public_key().encode())
+    )
     if "error" in access_key_resp or "result" not in access_key_resp:
         return {
             "error": {
                 "message": (
                     "Could not fetch access key. "
-                    "Ensure NEAR_ACCOUNT_ID and NEAR_PRIVATE_KEY are configured."
+                    f"NEAR_PRIVATE_KEY must be a full-access key of `{account_id}`."
                 )
             }
         }
-
     ak_result = access_key_resp["result"]
-    nonce = ak_result["nonce"] + 1
-    block_hash = ak_result["block_hash"]
+    return {
+        "result": {
+            "nonce": ak_result["nonce"] + 1,
+            "block_hash": base58.b58decode(ak_result["block_hash"]),
+        }
+    }
+
+
+async def send_deploy_tx(
+    account_id: str, wasm_bytes: bytes, access_key: dict | None = None
+) -> dict:
+    """
+    Build, sign, and broadcast a DeployContract transaction via NEAR RPC.
 
-    # Encode the WASM as base64 for the deploy action
-    wasm_b64 = base64.b64encode(wasm_bytes).decode("ascii")
+    The transaction is borsh-serialized and signed locally with the
+    ed25519 key from NEAR_PRIVATE_KEY, then submitted with
+    broadcast_tx_commit.  ``access_key`` is a fetch_access_key() result;
+    callers can start that lookup early and pass it in.
+    """
+    if access_key is None:
+        access_key = await fetch_access_key(account_id)
+    if "error" in access_key:
+        return access_key
 
-    # Use broadcast_tx_async for large deploys; the caller polls status
-    # For the bot we use the signed-transaction flow
-    # NOTE: Full local signing requires ed25519 — we simulate via RPC helper
-    return await _broadcast_deploy(account_id, nonce, block_hash, wasm_b64)
+    ak = access_key["result"]
+    return await _broadcast_deploy(account_id, ak["nonce"], ak["block_hash"], wasm_bytes)
 
 
-def _derive_public_key() -> str:
+def _load_signing_key() -> nacl.signing.SigningKey | None:
     """
-    Derive the ed25519 public key from NEAR_PRIVATE_KEY.
+    Parse NEAR_PRIVATE_KEY into an ed25519 signing key.
 
     Expects the key in the format 'ed25519:<base58-encoded-key>' as used
-    by NEAR CLI.  The first 32 bytes are the secret, the last 32 are
-    the public key (for 64-byte combined keys), or the key is 32 bytes
-    and the public part must be derived.
+    by NEAR CLI.  The first 32 bytes are the secret seed; 64-byte combined
+    keys carry the public key in the last 32.
     """
-    if not NEAR_PRIVATE_KEY:
-        return ""
-    # Placeholder — in production use the ed25519 library
-    # Return configured public key if available
-    pub = os.environ.get("NEAR_PUBLIC_KEY", "")
-    return pub
+    if not NEAR_PRIVATE_KEY.startswith("ed25519:"):
+        return None
+    try:
+        raw = base58.b58decode(NEAR_PRIVATE_KEY.removeprefix("ed25519:"))
+    except ValueError:
+        return None
+    if len(raw) not in (32, 64):
+        return None
+    return nacl.signing.SigningKey(raw[:32])
+
+
+_SIGNING_KEY = _load_signing_key()
+_PUBLIC_KEY = bytes(_SIGNING_KEY.verify_key) if _SIGNING_KEY else b""
+_PUBLIC_KEY_B58 = (
+    "ed25519:" + base58.b58encode(_PUBLIC_KEY).decode("ascii") if _SIGNING_KEY else ""
+)
+
+
+def _derive_public_key() -> str:
+    """Return the NEAR-formatted public key matching NEAR_PRIVATE_KEY."""
+    return _PUBLIC_KEY_B58
+
+
+def _borsh_string(value: str) -> bytes:
+    raw = value.encode()
+    return struct.pack("<I", len(raw)) + raw
+
+
+def _serialize_deploy_tx(
+    account_id: str, public_key: bytes, nonce: int, block_hash: bytes, code: bytes
+) -> bytes:
+    """Borsh-encode a Transaction with a single DeployContract action."""
+    return b"".join((
+        _borsh_string(account_id),            # signer_id
+        b"\x00", public_key,                  # PublicKey::ED25519
+        struct.pack("<Q", nonce),
+        _borsh_string(account_id),            # receiver_id
+        block_hash,
+        struct.pack("<I", 1),                 # actions: one entry
+        b"\x01",                              # Action::DeployContract
+        struct.pack("<I", len(code)), code,
+    ))
+
+
+def _signed_deploy_body(
+    account_id: str, nonce: int, block_hash: bytes, wasm_bytes: bytes
+) -> bytes:
+    """Sign a DeployContract transaction and wrap it in a broadcast_tx_commit request body."""
+    tx = _serialize_deploy_tx(account_id, _PUBLIC_KEY, nonce, block_hash, wasm_bytes)
+    signature = _SIGNING_KEY.sign(hashlib.sha256(tx).digest()).signature
+    signed_tx = tx + b"\x00" + signature     # Signature::ED25519
+    return orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": "deployer",
+        "method": "broadcast_tx_commit",
+        "params": [base64.b64encode(signed_tx).decode("ascii")],
+    })
 
 
 async def _broadcast_deploy(
-    account_id: str, nonce: int, block_hash: str, wasm_b64: str
+    account_id: str, nonce: int, block_hash: bytes, wasm_bytes: bytes
 ) -> dict:
-    """
-    Broadcast a signed DeployContract transaction.
+    """Sign a DeployContract transaction and broadcast it via broadcast_tx_commit."""
+    # Hashing, base64 and JSON-encoding a multi-MB transaction takes long enough
+    # to hold up other interactions, so it runs in a worker thread.
+    body = await asyncio.to_thread(
+        _signed_deploy_body, account_id, nonce, block_hash, wasm_bytes
+    )
+    result = await _rpc_post(timeout=120, data=body)
+    if "error" in result:
+        err = result["error"]
+        return {"error": {"message": str(err.get("data") or err.get("message", err))}}
 
-    Full local signing requires the `ed25519` or `py-near` library.
-    This function prepares the transaction parameters and delegates
-    to the RPC.  For a working deployment, install `py-near` and
-    use its transaction builder, or call `near-cli` as a subprocess.
-    """
-    # Fallback: use near-cli subprocess for signing and sending
-    import subprocess
-    import shutil
+    outcome = result.get("result", {})
+    tx_hash = outcome.get("transaction", {}).get("hash", "unknown")
+    status = outcome.get("status", {})
+    if isinstance(status, dict) and "Failure" in status:
+        return {"error": {"message": json.dumps(status["Failure"])}}
+    return {"result": {"tx_hash": tx_hash}}
 
-    near_cli = shutil.which("near") or shutil.which("near-cli")
-    if not near_cli:
-        return {"error": {"message": "near-cli not found. Install with `npm i -g near-cli`."}}
 
-    # Write wasm to temp file
-    tmp_wasm = DATA_DIR / f"_deploy_{int(time.time())}.wasm"
-    tmp_wasm.write_bytes(base64.b64decode(wasm_b64))
+# --- Embeds -----------------------------------------------------------------
 
-    try:
-        env = os.environ.copy()
-        cmd = [
-            near_cli, "deploy",
-            "--accountId", account_id,
-            "--wasmFile", str(tmp_wasm),
-            "--networkId", NEAR_NETWORK,
-        ]
-        proc = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=120, env=env,
-        )
-        if proc.returncode != 0:
-            return {"error": {"message": proc.stderr or "near-cli deploy failed"}}
-
-        # Try to extract tx hash from output
-        tx_hash = _extract_tx_hash(proc.stdout)
-        return {"result": {"tx_hash": tx_hash, "output": proc.stdout[-500:]}}
-    except subprocess.TimeoutExpired:
-        return {"error": {"message": "Deploy timed out after 120 seconds"}}
-    except Exception as exc:
-        return {"error": {"message": str(exc)}}
-    finally:
-        tmp_wasm.unlink(missing_ok=True)
+# Code-fence wrappers for embed fields, bound once
+JSON_BLOCK = "```json\n{}\n```".format
+BASH_BLOCK = "```bash\n{}\n```".format
+NEAR_CALL_TEMPLATE = "near call {contract} {method} '{args}' --accountId {signer} --gas {gas}"
 
 
-def _extract_tx_hash(output: str) -> str:
-    """Pull the transaction hash from near-cli output."""
-    for line in output.splitlines():
-        line = line.strip()
-        # near-cli prints: Transaction Id <hash>
-        if "transaction id" in line.lower():
-            parts = line.split()
-            for part in parts:
-                if len(part) >= 40 and part.isalnum():
-                    return part
-        # Also check for raw base58 hashes on their own line
-        if len(line) >= 43 and len(line) <= 44 and line.isalnum():
-            return line
-    return "unknown"
+def pretty_json(value) -> str:
+    """Indented JSON for embed code blocks."""
+    try:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+    except TypeError:
+        # orjson refuses integers wider than 64 bits (e.g. raw u128 amounts)
+        return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+@lru_cache(maxsize=256)
+def build_cli_cmd(contract: str, method: str, args_json: str, gas: int, deposit: float) -> str:
+    """near-cli call command; args arrive pre-serialized so they can key the cache."""
+    cmd = NEAR_CALL_TEMPLATE.format(
+        contract=contract,
+        method=method,
+        args=args_json,
+        signer=NEAR_ACCOUNT_ID or "<your-account.near>",
+        gas=gas * 10**12,
+    )
+    if deposit > 0:
+        cmd += f" --deposit {deposit}"
+    return cmd
+
 
+DEPLOY_STAGES = {
+    "downloading": ("Downloading WASM", discord.Color.blue()),
+    "validating": ("Validating contract", discord.Color.blue()),
+    "deploying": ("Deploying to NEAR", discord.Color.orange()),
+    "success": ("Deployment successful", discord.Color.green()),
+    "failed": ("Deployment failed", discord.Color.red()),
+}
+DEPLOY_STAGE_DEFAULT = ("Processing", discord.Color.greyple())
 
-# --- Embeds -----------------------------------------------------------------
 
 def deploy_progress_embed(stage: str, contract: str) -> discord.Embed:
-    stages = {
-        "downloading": ("Downloading WASM", discord.Color.blue()),
-        "validating": ("Validating contract", discord.Color.blue()),
-        "deploying": ("Deploying to NEAR", discord.Color.orange()),
-        "success": ("Deployment successful", discord.Color.green()),
-        "failed": ("Deployment failed", discord.Color.red()),
-    }
-    title, color = stages.get(stage, ("Processing", discord.Color.greyple()))
+    title, color = DEPLOY_STAGES.get(stage, DEPLOY_STAGE_DEFAULT)
     embed = discord.Embed(title=title, color=color)
     embed.add_field(name="Contract", value=f"`{contract}`", inline=True)
     embed.add_field(name="Network", value=NEAR_NETWORK, inline=True)
     return embed
 
 
+# Discord edits cost a REST call each; progress updates closer together
+# than this are coalesced so only the latest one is shown.
+PROGRESS_EDIT_INTERVAL = 0.75
+
+
+class ProgressMessage:
+    """
+    Edits a progress message, holding back intermediate updates.
+
+    An update arriving within PROGRESS_EDIT_INTERVAL of the last edit is
+    delayed, and replaced if a newer one comes in first.  Final updates
+    are sent immediately and drop anything still pending.
+    """
+
+    __slots__ = ("msg", "_last_edit", "_pending")
+
+    def __init__(self, msg: discord.WebhookMessage):
+        self.msg = msg
+        self._last_edit = time.monotonic()
+        self._pending: asyncio.Task | None = None
+
+    async def update(self, embed: discord.Embed, final: bool = False):
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        delay = self._last_edit + PROGRESS_EDIT_INTERVAL - time.monotonic()
+        if final or delay <= 0:
+            await self._edit(embed)
+        else:
+            self._pending = asyncio.create_task(self._edit_later(embed, delay))
+
+    async def _edit_later(self, embed: discord.Embed, delay: float):
+        await asyncio.sleep(delay)
+        # Nothing awaits this task, so failures (e.g. an expired interaction
+        # token) must be logged here rather than surface as unretrieved.
+        try:
+            await self._edit(embed)
+        except discord.HTTPException as e:
+            log.warning("Progress update failed: %s", e)
+
+    async def _edit(self, embed: discord.Embed):
+        self._last_edit = time.monotonic()
+        await self.msg.edit(embed=embed)
+
+
 def contract_info_embed(account_id: str, account: dict, code: dict | None) -> discord.Embed:
     balance_near = int(account.get("amount", "0")) / 1e24
     storage_bytes = account.get("storage_usage", 0)
@@ -323,14 +686,14 @@ def contract_info_embed(account_id: str, account: dict, code: dict | None) -> di
     embed.add_field(name="Storage", value=f"{storage_bytes:,} bytes", inline=True)
     embed.add_field(
         name="Has Contract",
-        value="Yes" if code and code.get("code_base64") else "No",
+        value="Yes" if code and code.get("code_size") else "No",
         inline=True,
     )
 
     if code and code.get("hash"):
         embed.add_field(name="Code Hash", value=f"`{code['hash'][:16]}...`", inline=False)
 
-    embed.set_footer(text=f"Network: {NEAR_NETWORK}")
+    embed.set_footer(text=NETWORK_FOOTER)
     return embed
 
 
@@ -403,10 +766,14 @@ def help_embed() -> discord.Embed:
         ),
         inline=False,
     )
-    embed.set_footer(text=f"Network: {NEAR_NETWORK} | RPC: {RPC_URL}")
+    embed.set_footer(text=NETWORK_RPC_LINE)
     return embed
 
 
+# The help text only depends on config read at import, so build it once.
+HELP_EMBED = help_embed()
+
+
 # --- Slash Commands ---------------------------------------------------------
 
 @bot.tree.command(name="deploy", description="Deploy a WASM contract to NEAR")
@@ -447,53 +814,58 @@ async def deploy_command(
 
     # Stage 1: Download
     progress = deploy_progress_embed("downloading", contract_account)
-    msg = await interaction.followup.send(embed=progress)
+    msg = ProgressMessage(await interaction.followup.send(embed=progress))
 
-    wasm_bytes = await download_wasm(wasm_url)
-    if wasm_bytes is None:
-        fail = deploy_progress_embed("failed", contract_account)
-        fail.add_field(
-            name="Error",
-            value="Could not download WASM file. Check the URL and ensure it points to a valid `.wasm` binary.",
-            inline=False,
-        )
-        await msg.edit(embed=fail)
-        return
+    # The access-key lookup doesn't depend on the WASM, so overlap it with the download
+    access_key_task = asyncio.create_task(fetch_access_key(contract_account))
+    try:
+        hasher = hashlib.sha256()
+        wasm_bytes = await download_wasm(wasm_url, hasher)
+        if wasm_bytes is None:
+            fail = deploy_progress_embed("failed", contract_account)
+            fail.add_field(
+                name="Error",
+                value=(
+                    "Could not download WASM file. Check the URL and ensure it points to "
+                    "a valid `.wasm` binary under 4 MB."
+                ),
+                inline=False,
+            )
+            await msg.update(fail, final=True)
+            return
 
-    wasm_hash = hashlib.sha256(wasm_bytes).hexdigest()
-    wasm_size_kb = len(wasm_bytes) / 1024
+        wasm_hash = hasher.hexdigest()
+        wasm_size_kb = len(wasm_bytes) / 1024
 
-    # Stage 2: Validate
-    progress = deploy_progress_embed("validating", contract_account)
-    progress.add_field(name="WASM Size", value=f"{wasm_size_kb:.1f} KB", inline=True)
-    progress.add_field(name="SHA-256", value=f"`{wasm_hash[:16]}...`", inline=True)
-    await msg.edit(embed=progress)
+        # Stage 2: Validate
+        progress = deploy_progress_embed("validating", contract_account)
+        progress.add_field(name="WASM Size", value=f"{wasm_size_kb:.1f} KB", inline=True)
+        progress.add_field(name="SHA-256", value=f"`{wasm_hash[:16]}...`", inline=True)
+        await msg.update(progress)
 
-    # Size sanity check (NEAR max is ~4MB for contract code)
-    if len(wasm_bytes) > 4 * 1024 * 1024:
-        fail = deploy_progress_embed("failed", contract_account)
-        fail.add_field(
-            name="Error",
-            value=f"WASM file is too large ({wasm_size_kb:.0f} KB). NEAR contracts must be under 4 MB.",
-            inline=False,
-        )
-        await msg.edit(embed=fail)
-        return
+        # Stage 3: Deploy
+        progress = deploy_progress_embed("deploying", contract_account)
+        progress.add_field(name="WASM Size", value=f"{wasm_size_kb:.1f} KB", inline=True)
+        progress.add_field(name="SHA-256", value=f"`{wasm_hash[:16]}...`", inline=True)
+        await msg.update(progress)
 
-    # Stage 3: Deploy
-    progress = deploy_progress_embed("deploying", contract_account)
-    progress.add_field(name="WASM Size", value=f"{wasm_size_kb:.1f} KB", inline=True)
-    progress.add_field(name="SHA-256", value=f"`{wasm_hash[:16]}...`", inline=True)
-    await msg.edit(embed=progress)
+        access_key = await access_key_task
+    finally:
+        # Any early exit (failed download, a progress edit raising) must not
+        # leave the lookup running or its outcome unretrieved
+        if not access_key_task.done():
+            access_key_task.cancel()
+        elif not access_key_task.cancelled():
+            access_key_task.exception()
 
-    deploy_result = await send_deploy_tx(contract_account, wasm_bytes)
+    deploy_result = await send_deploy_tx(contract_account, wasm_bytes, access_key)
 
     if "error" in deploy_result:
         err_msg = deploy_result["error"].get("message", "Unknown error")
         fail = deploy_progress_embed("failed", contract_account)
         fail.add_field(name="Error", value=err_msg[:1024], inline=False)
-        await msg.edit(embed=fail)
-        _record_deployment(user_id, contract_account, "", NEAR_NETWORK, wasm_hash, "failed")
+        await msg.update(fail, final=True)
+        await _record_deployment(user_id, contract_account, "", NEAR_NETWORK, wasm_hash, "failed")
         return
 
     # Stage 4: Success
@@ -509,9 +881,11 @@ async def deploy_command(
             inline=False,
         )
     success.set_footer(text=f"Deployed by {interaction.user.display_name} | {NEAR_NETWORK}")
-    await msg.edit(embed=success)
+    await msg.update(success, final=True)
 
-    _record_deployment(user_id, contract_account, tx_hash, NEAR_NETWORK, wasm_hash, "deployed")
+    _invalidate_views(contract_account)
+
+    await _record_deployment(user_id, contract_account, tx_hash, NEAR_NETWORK, wasm_hash, "deployed")
 
 
 @bot.tree.command(name="status", description="Check contract or transaction status")
@@ -563,7 +937,9 @@ async def status_command(
         return
 
     # Otherwise look up the account / contract state
-    account = await view_account(contract_account)
+    account, code = await asyncio.gather(
+        view_account(contract_account), view_code(contract_account)
+    )
     if account is None:
         await interaction.followup.send(
             embed=discord.Embed(
@@ -574,7 +950,6 @@ async def status_command(
         )
         return
 
-    code = await view_code(contract_account)
     embed = contract_info_embed(contract_account, account, code)
     await interaction.followup.send(embed=embed)
 
@@ -588,9 +963,10 @@ async def contracts_command(
     show_all: bool = False,
 ):
     await interaction.response.defer()
-    deployments = _load_deployments()
+    owner = None if show_all else str(interaction.user.id)
+    total = await _count_deployments(owner)
 
-    if not deployments:
+    if not total and (show_all or not await _count_deployments()):
         await interaction.followup.send(
             embed=discord.Embed(
                 title="No deployments",
@@ -600,13 +976,7 @@ async def contracts_command(
         )
         return
 
-    user_id = str(interaction.user.id)
-    records = list(deployments.values())
-
-    if not show_all:
-        records = [r for r in records if r.get("deployed_by") == user_id]
-
-    if not records:
+    if not total:
         await interaction.followup.send(
             embed=discord.Embed(
                 title="No deployments found",
@@ -616,14 +986,14 @@ async def contracts_command(
         )
         return
 
-    # Sort newest first
-    records.sort(key=lambda r: r.get("deployed_at", ""), reverse=True)
+    # Newest first, straight from the (deployed_by, deployed_at) index
+    records = await _recent_deployments(owner, limit=10)
 
-    embeds = [deployment_record_embed(r) for r in records[:10]]
+    embeds = [deployment_record_embed(r) for r in records]
     label = "All Deployments" if show_all else "Your Deployments"
     await interaction.followup.send(
-        f"**{label} ({len(records)} total):**",
-        embeds=embeds[:10],
+        f"**{label} ({total} total):**",
+        embeds=embeds,
     )
 
 
@@ -639,9 +1009,13 @@ async def verify_command(
 ):
     await interaction.response.defer()
 
-    # Fetch on-chain code
-    code = await view_code(contract_account)
-    if code is None or not code.get("code_base64"):
+    # Fetch on-chain code and the reference WASM concurrently; the reference
+    # is hashed as it streams in
+    ref_hasher = hashlib.sha256()
+    code, ref_wasm = await asyncio.gather(
+        view_code(contract_account), download_wasm(wasm_url, ref_hasher)
+    )
+    if code is None or not code.get("code_size") or not code.get("hash"):
         await interaction.followup.send(
             embed=discord.Embed(
                 title="No contract found",
@@ -651,8 +1025,6 @@ async def verify_command(
         )
         return
 
-    # Download reference WASM
-    ref_wasm = await download_wasm(wasm_url)
     if ref_wasm is None:
         await interaction.followup.send(
             embed=discord.Embed(
@@ -664,10 +1036,13 @@ async def verify_command(
         return
 
     # Compare hashes
-    on_chain_bytes = base64.b64decode(code["code_base64"])
-    on_chain_hash = hashlib.sha256(on_chain_bytes).hexdigest()
-    ref_hash = hashlib.sha256(ref_wasm).hexdigest()
-    match = on_chain_hash == ref_hash
+    # view_code already reports the base58 SHA-256 of the deployed code, so
+    # the on-chain blob never needs decoding or hashing here
+    on_chain_digest = base58.b58decode(code["hash"])
+    match = hmac.compare_digest(on_chain_digest, ref_hasher.digest())
+    on_chain_hash = on_chain_digest.hex()
+    ref_hash = ref_hasher.hexdigest()
+    on_chain_size = code["code_size"]
 
     embed = discord.Embed(
         title="Verification Result",
@@ -684,7 +1059,7 @@ async def verify_command(
     embed.add_field(name="Reference Hash", value=f"`{ref_hash[:32]}...`", inline=False)
     embed.add_field(
         name="On-chain Size",
-        value=f"{len(on_chain_bytes) / 1024:.1f} KB",
+        value=f"{on_chain_size / 1024:.1f} KB",
         inline=True,
     )
     embed.add_field(
@@ -743,7 +1118,7 @@ async def view_command(
     if "error" in result:
         err_msg = result["error"].get("message", "Unknown error")
         if isinstance(err_msg, dict):
-            err_msg = json.dumps(err_msg, indent=2)[:1000]
+            err_msg = pretty_json(err_msg)[:1000]
         await interaction.followup.send(
             embed=discord.Embed(
                 title="View call failed",
@@ -761,7 +1136,7 @@ async def view_command(
             decoded = bytes(raw_result).decode("utf-8")
             try:
                 parsed = json.loads(decoded)
-                display = json.dumps(parsed, indent=2)
+                display = pretty_json(parsed)
             except json.JSONDecodeError:
                 display = decoded
         except (UnicodeDecodeError, ValueError):
@@ -781,18 +1156,18 @@ async def view_command(
     embed.add_field(name="Method", value=f"`{method}`", inline=True)
     embed.add_field(name="Network", value=NEAR_NETWORK, inline=True)
     if parsed_args:
-        args_display = json.dumps(parsed_args, indent=2)
+        args_display = pretty_json(parsed_args)
         if len(args_display) > 500:
             args_display = args_display[:500] + "..."
-        embed.add_field(name="Arguments", value=f"```json\n{args_display}\n```", inline=False)
-    embed.add_field(name="Result", value=f"```json\n{display}\n```", inline=False)
+        embed.add_field(name="Arguments", value=JSON_BLOCK(args_display), inline=False)
+    embed.add_field(name="Result", value=JSON_BLOCK(display), inline=False)
 
     logs = result_data.get("logs", [])
     if logs:
         log_text = "\n".join(logs[:10])
         embed.add_field(name="Logs", value=f"```\n{log_text[:500]}\n```", inline=False)
 
-    embed.set_footer(text=f"Network: {NEAR_NETWORK}")
+    embed.set_footer(text=NETWORK_FOOTER)
     await interaction.followup.send(embed=embed)
 
 
@@ -827,22 +1202,7 @@ async def call_command(
         )
         return
 
-    signer = NEAR_ACCOUNT_ID or "<your-account.near>"
-    gas_yocto = str(gas * 10**12)
-
-    if deposit > 0:
-        deposit_str = str(deposit)
-        cli_cmd = (
-            f"near call {contract_account} {method} "
-            f"'{json.dumps(parsed_args)}' "
-            f"--accountId {signer} --gas {gas_yocto} --deposit {deposit_str}"
-        )
-    else:
-        cli_cmd = (
-            f"near call {contract_account} {method} "
-            f"'{json.dumps(parsed_args)}' "
-            f"--accountId {signer} --gas {gas_yocto}"
-        )
+    cli_cmd = build_cli_cmd(contract_account, method, json.dumps(parsed_args), gas, deposit)
 
     embed = discord.Embed(
         title=f"Call: {contract_account}.{method}()",
@@ -857,51 +1217,116 @@ async def call_command(
         embed.add_field(name="Deposit", value=f"{deposit} NEAR", inline=True)
 
     if parsed_args:
-        args_display = json.dumps(parsed_args, indent=2)
+        args_display = pretty_json(parsed_args)
         if len(args_display) > 500:
             args_display = args_display[:500] + "..."
-        embed.add_field(name="Arguments", value=f"```json\n{args_display}\n```", inline=False)
+        embed.add_field(name="Arguments", value=JSON_BLOCK(args_display), inline=False)
 
     embed.add_field(
         name="Execute via near-cli",
-        value=f"```bash\n{cli_cmd}\n```",
+        value=BASH_BLOCK(cli_cmd),
         inline=False,
     )
-    embed.set_footer(
-        text=f"Network: {NEAR_NETWORK} | Run this command in your terminal with near-cli installed."
-    )
+    embed.set_footer(text=CALL_FOOTER)
 
     await interaction.followup.send(embed=embed)
 
 
 @bot.tree.command(name="deployer-help", description="Show contract deployer help and workflow guide")
 async def deployer_help_command(interaction: discord.Interaction):
-    await interaction.response.send_message(embed=help_embed())
+    # Sent as-is: discord.py only serializes the embed, it never mutates it
+    await interaction.response.send_message(embed=HELP_EMBED)
 
 
 # --- Bot Events -------------------------------------------------------------
 
+def _command_signature() -> str:
+    """Digest of the slash command definitions, used to skip redundant syncs."""
+    spec = [
+        (
+            cmd.name,
+            cmd.description,
+            [(p.name, p.description, str(p.type), p.required) for p in cmd.parameters],
+        )
+        for cmd in sorted(bot.tree.get_commands(), key=lambda c: c.name)
+    ]
+    return hashlib.sha256(repr((bot.application_id, DEV_GUILD_ID, spec)).encode()).hexdigest()
+
+
+async def sync_commands():
+    """
+    Sync slash commands with Discord, but only when they changed.
+
+    Global syncs are heavily rate limited, so the digest of the last
+    successful sync is kept in COMMAND_SYNC_FILE and a matching tree is
+    not pushed again.  Each attempt is capped at SYNC_TIMEOUT; timeouts
+    and server errors are retried with exponential backoff.
+    """
+    signature = _command_signature()
+    if COMMAND_SYNC_FILE.exists() and COMMAND_SYNC_FILE.read_text() == signature:
+        log.info("Slash commands unchanged since last sync")
+        return
+    guild = discord.Object(id=int(DEV_GUILD_ID)) if DEV_GUILD_ID else None
+    if guild is not None:
+        bot.tree.copy_global_to(guild=guild)
+    target = f"guild {DEV_GUILD_ID}" if guild is not None else "global"
+    for attempt in range(SYNC_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(min(300, 2 ** attempt))
+        try:
+            synced = await asyncio.wait_for(bot.tree.sync(guild=guild), timeout=SYNC_TIMEOUT)
+        except asyncio.TimeoutError:
+            log.warning("Sync timed out after %ss (attempt %d)", SYNC_TIMEOUT, attempt + 1)
+        except discord.HTTPException as e:
+            if e.status < 500:
+                log.exception("Sync error: %s", e, extra={"event": "sync_error", "status": e.status})
+                return
+            log.warning("Sync error: %s (attempt %d)", e, attempt + 1)
+        else:
+            log.info(
+                "Synced %d slash commands (%s)", len(synced), target,
+                extra={"event": "slash_sync", "count": len(synced), "target": target, "network": NEAR_NETWORK},
+            )
+            COMMAND_SYNC_FILE.write_text(signature)
+            return
+    log.error(
+        "Giving up on slash command sync after %d attempts", SYNC_ATTEMPTS,
+        extra={"event": "sync_error", "attempts": SYNC_ATTEMPTS},
+    )
+
+
 @bot.event
 async def on_ready():
-    print(f"Contract Deployer Bot ready: {bot.user} (ID: {bot.user.id})")
-    print(f"Network: {NEAR_NETWORK} | RPC: {RPC_URL}")
-    try:
-        synced = await bot.tree.sync()
-        print(f"Synced {len(synced)} slash commands")
-    except Exception as e:
-        print(f"Sync error: {e}")
+    log.info("Contract Deployer Bot ready: %s (ID: %s)", bot.user, bot.user.id)
+    log.info(NETWORK_RPC_LINE)
+    # on_ready fires again after every reconnect; sync once per process, in
+    # the background so a slow Discord API doesn't hold anything up
+    if bot.sync_task is None:
+        bot.sync_task = asyncio.create_task(sync_commands())
 
 
 # --- Entry Point ------------------------------------------------------------
 
 def main():
-    if not DISCORD_TOKEN:
-        print("ERROR: Set DISCORD_BOT_TOKEN environment variable")
-        print("  export DISCORD_BOT_TOKEN=your_token_here")
-        return
-    if not NEAR_ACCOUNT_ID:
-        print("WARNING: NEAR_ACCOUNT_ID not set. Deploy commands will fail.")
-    bot.run(DISCORD_TOKEN)
+    _log_listener.start()
+    try:
+        missing = [name for name, value in REQUIRED_ENV.items() if not value]
+        if missing:
+            log.error("Missing required environment variables: %s", ", ".join(missing))
+            # Non-zero so process managers treat this as a failed start
+            sys.exit(2)
+        for name, (value, consequence) in OPTIONAL_ENV.items():
+            if not value:
+                log.warning("%s not set. %s", name, consequence)
+        if DEV_GUILD_ID and not DEV_GUILD_ID.isdigit():
+            log.error("DISCORD_DEV_GUILD_ID must be a numeric guild ID")
+            sys.exit(2)
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        # discord.py's own records go through the root queue handler too
+        bot.run(DISCORD_TOKEN, log_handler=None)
+    finally:
+        _log_listener.stop()
 
 
 if __name__ == "__main__":
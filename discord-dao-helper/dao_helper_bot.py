@@ -6,22 +6,28 @@ Discord bot for NEAR Sputnik DAO v2 governance operations.
 Browse proposals, vote, create proposals, and inspect DAO treasury
 directly from Discord.
 
-Requires: discord.py, aiohttp, python-dotenv
+Requires: discord.py, aiohttp, python-dotenv, orjson
 Environment:
     DISCORD_BOT_TOKEN  — Discord bot token
     NEAR_ACCOUNT_ID    — Your NEAR account (for building CLI commands)
     NEAR_RPC_URL       — RPC endpoint (default: mainnet)
     DEFAULT_DAO_ID     — Default DAO contract to interact with
+    DISCORD_DEV_GUILD_ID — Optional guild to sync slash commands to (instant, for development)
 """
 
 import asyncio
 import base64
 import json
 import os
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 
 import aiohttp
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
@@ -34,6 +40,7 @@ DISCORD_TOKEN = os.environ.get("DISCORD_BOT_TOKEN", "")
 NEAR_ACCOUNT = os.environ.get("NEAR_ACCOUNT_ID", "")
 NEAR_RPC = os.environ.get("NEAR_RPC_URL", "https://rpc.mainnet.near.org")
 DEFAULT_DAO = os.environ.get("DEFAULT_DAO_ID", "")
+DEV_GUILD_ID = os.environ.get("DISCORD_DEV_GUILD_ID", "")
 
 # Well-known Sputnik DAOs for autocomplete suggestions
 KNOWN_DAOS = [
@@ -47,13 +54,60 @@ KNOWN_DAOS = [
     "ref-community-board.sputnik-dao.near",
 ]
 
+
+class DaoHelperBot(commands.Bot):
+    async def setup_hook(self):
+        # Runs once per process, after every command is registered, so the
+        # whole tree goes up in one bulk overwrite (on_ready fires again on
+        # every reconnect).
+        guild = discord.Object(id=int(DEV_GUILD_ID)) if DEV_GUILD_ID.isdigit() else None
+        if guild is not None:
+            self.tree.copy_global_to(guild=guild)
+        try:
+            synced = await self.tree.sync(guild=guild)
+            print(f"Synced {len(synced)} slash commands" + (f" to guild {DEV_GUILD_ID}" if guild else ""))
+        except Exception as e:
+            print(f"Sync error: {e}")
+
+    async def close(self):
+        await super().close()
+        await close_session()
+
+
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = DaoHelperBot(command_prefix="!", intents=intents)
 
 
 # ─── NEAR RPC Client (async) ─────────────────────────────────────
 
+_session: aiohttp.ClientSession | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Shared session so every RPC call reuses pooled keep-alive connections."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=15),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60),
+        )
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+# Cap on concurrent requests to the RPC node, so gathered fan-outs
+# (e.g. the treasury token scan) stay within provider limits.
+_rpc_slots = asyncio.Semaphore(8)
+
+
 async def rpc_call(method: str, params: dict) -> dict:
     """Make an async NEAR JSON-RPC call."""
     payload = {
@@ -62,24 +116,48 @@ async def rpc_call(method: str, params: dict) -> dict:
         "method": method,
         "params": params,
     }
+    session = await get_session()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                NEAR_RPC,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=15),
-            ) as resp:
-                result = await resp.json()
-                if "error" in result:
-                    return {"error": result["error"]}
-                return result.get("result", {})
+        async with _rpc_slots, session.post(NEAR_RPC, json=payload) as resp:
+            result = orjson.loads(await resp.read())
+            if "error" in result:
+                return {"error": result["error"]}
+            return result.get("result", {})
     except Exception as e:
         return {"error": str(e)}
 
 
+_EMPTY_ARGS_B64 = base64.b64encode(b"{}").decode()
+
+
+def _args_json(args: dict | None) -> bytes:
+    """Canonical JSON for view args, so equal dicts encode (and cache) identically."""
+    return orjson.dumps(args, option=orjson.OPT_SORT_KEYS) if args else b"{}"
+
+
+@lru_cache(maxsize=1024)
+def _encode_args(args_json: bytes) -> str:
+    return base64.b64encode(args_json).decode()
+
+
+# Identical view calls already on the wire, shared by concurrent callers
+_inflight: dict[tuple[str, str, str], asyncio.Task] = {}
+
+
 async def view_call(contract: str, method: str, args: dict | None = None):
     """Call a view method on a NEAR contract."""
-    args_b64 = base64.b64encode(json.dumps(args or {}).encode()).decode()
+    args_b64 = _encode_args(_args_json(args)) if args else _EMPTY_ARGS_B64
+    key = (contract, method, args_b64)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_view(contract, method, args_b64))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller giving up doesn't cancel the request for the rest
+    return await asyncio.shield(task)
+
+
+async def _fetch_view(contract: str, method: str, args_b64: str):
     result = await rpc_call("query", {
         "request_type": "call_function",
         "finality": "final",
@@ -94,14 +172,38 @@ async def view_call(contract: str, method: str, args: dict | None = None):
     result_bytes = result.get("result", [])
     if isinstance(result_bytes, list):
         try:
-            decoded = bytes(result_bytes).decode("utf-8")
-            return json.loads(decoded)
-        except (json.JSONDecodeError, UnicodeDecodeError):
+            return orjson.loads(bytes(result_bytes))
+        except orjson.JSONDecodeError:  # also raised for invalid UTF-8
             return {"raw": str(result_bytes)}
 
     return result
 
 
+# Policies, proposal pages and token metadata change rarely compared to how
+# often commands re-read them, so view results can be reused for a while.
+POLICY_TTL = 30
+PROPOSALS_TTL = 10
+FT_METADATA_TTL = 3600
+VIEW_CACHE_SIZE = 512
+_view_cache: OrderedDict[tuple[str, str, bytes], tuple[float, object]] = OrderedDict()
+
+
+async def cached_view_call(contract: str, method: str, args: dict | None = None, ttl: float = POLICY_TTL):
+    """view_call, reusing successful results younger than ttl seconds."""
+    cache_key = (contract, method, _args_json(args))
+    cached = _view_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        _view_cache.move_to_end(cache_key)
+        return cached[1]
+    result = await view_call(contract, method, args)
+    if not (isinstance(result, dict) and ("error" in result or "raw" in result)):
+        _view_cache[cache_key] = (time.monotonic(), result)
+        _view_cache.move_to_end(cache_key)
+        if len(_view_cache) > VIEW_CACHE_SIZE:
+            _view_cache.popitem(last=False)
+    return result
+
+
 async def view_account(account_id: str) -> dict:
     """Get NEAR account info."""
     return await rpc_call("query", {
@@ -111,10 +213,17 @@ async def view_account(account_id: str) -> dict:
     })
 
 
+YOCTO_PER_NEAR = 10**24
+
+
 def yocto_to_near(yocto) -> float:
     """Convert yoctoNEAR to NEAR."""
     try:
-        return int(yocto) / 1e24
+        if isinstance(yocto, str):
+            # RPC amounts are decimal strings: shifting the exponent lets the
+            # float parser round once, without building a 25+ digit int
+            return float(yocto + "e-24")
+        return int(yocto) / YOCTO_PER_NEAR
     except (ValueError, TypeError):
         return 0.0
 
@@ -150,64 +259,71 @@ def resolve_dao(dao_id: str | None) -> str | None:
 
 # ─── Autocomplete ─────────────────────────────────────────────────
 
+# Autocomplete runs on every keystroke, so choices and their lowercased
+# match keys are built once here instead of per call.
+_DAO_CHOICES = [
+    (d.lower(), app_commands.Choice(name=d, value=d)) for d in KNOWN_DAOS
+]
+_DAO_FALLBACK = [c for _, c in _DAO_CHOICES[:25]]
+
+_VOTE_CHOICES = [
+    (c.name.lower(), c) for c in (
+        app_commands.Choice(name="Approve", value="approve"),
+        app_commands.Choice(name="Reject", value="reject"),
+        app_commands.Choice(name="Remove", value="remove"),
+    )
+]
+
+_PROPOSAL_KIND_CHOICES = [
+    (c.name.lower(), c) for c in (
+        app_commands.Choice(name="Transfer NEAR or tokens", value="transfer"),
+        app_commands.Choice(name="Function call", value="function_call"),
+        app_commands.Choice(name="Poll / vote", value="vote"),
+        app_commands.Choice(name="Add council member", value="add_member"),
+        app_commands.Choice(name="Remove council member", value="remove_member"),
+    )
+]
+
+
 async def dao_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
     """Autocomplete for DAO IDs."""
-    matches = [
-        d for d in KNOWN_DAOS if current.lower() in d.lower()
-    ]
-    if not matches:
-        matches = KNOWN_DAOS
-    return [
-        app_commands.Choice(name=d, value=d)
-        for d in matches[:25]
-    ]
+    current = current.lower()
+    matches = [c for key, c in _DAO_CHOICES if current in key]
+    return matches[:25] or _DAO_FALLBACK
 
 
 async def vote_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
     """Autocomplete for vote actions."""
-    choices = [
-        app_commands.Choice(name="Approve", value="approve"),
-        app_commands.Choice(name="Reject", value="reject"),
-        app_commands.Choice(name="Remove", value="remove"),
-    ]
-    if current:
-        choices = [c for c in choices if current.lower() in c.name.lower()]
-    return choices
+    current = current.lower()
+    return [c for key, c in _VOTE_CHOICES if current in key]
 
 
 async def proposal_kind_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
     """Autocomplete for proposal kinds."""
-    choices = [
-        app_commands.Choice(name="Transfer NEAR or tokens", value="transfer"),
-        app_commands.Choice(name="Function call", value="function_call"),
-        app_commands.Choice(name="Poll / vote", value="vote"),
-        app_commands.Choice(name="Add council member", value="add_member"),
-        app_commands.Choice(name="Remove council member", value="remove_member"),
-    ]
-    if current:
-        choices = [c for c in choices if current.lower() in c.name.lower()]
-    return choices
+    current = current.lower()
+    return [c for key, c in _PROPOSAL_KIND_CHOICES if current in key]
 
 
 # ─── Embeds ───────────────────────────────────────────────────────
 
-STATUS_COLORS = {
-    "InProgress": discord.Color.blue(),
-    "Approved": discord.Color.green(),
-    "Rejected": discord.Color.red(),
-    "Expired": discord.Color.dark_grey(),
-    "Removed": discord.Color.dark_red(),
-    "Moved": discord.Color.purple(),
-    "Failed": discord.Color.dark_red(),
-}
-
-STATUS_LABELS = {
+# Read-only lookups; colours are stored as raw ints (Embed accepts them directly)
+STATUS_COLORS = MappingProxyType({
+    "InProgress": discord.Color.blue().value,
+    "Approved": discord.Color.green().value,
+    "Rejected": discord.Color.red().value,
+    "Expired": discord.Color.dark_grey().value,
+    "Removed": discord.Color.dark_red().value,
+    "Moved": discord.Color.purple().value,
+    "Failed": discord.Color.dark_red().value,
+})
+
+STATUS_LABELS = MappingProxyType({
     "InProgress": "Active",
     "Approved": "Approved",
     "Rejected": "Rejected",
@@ -215,9 +331,9 @@ STATUS_LABELS = {
     "Removed": "Removed",
     "Moved": "Moved",
     "Failed": "Failed",
-}
+})
 
-KIND_LABELS = {
+KIND_LABELS = MappingProxyType({
     "Transfer": "Transfer",
     "FunctionCall": "Function Call",
     "ChangePolicy": "Policy Change",
@@ -233,7 +349,20 @@ KIND_LABELS = {
     "AddBounty": "Add Bounty",
     "BountyDone": "Bounty Done",
     "Vote": "Poll",
-}
+})
+
+# Bound once; proposal_embed runs these for every proposal in a listing
+_status_color = STATUS_COLORS.get
+_status_label = STATUS_LABELS.get
+_kind_label = KIND_LABELS.get
+
+VOTE_COLORS = MappingProxyType({
+    "approve": discord.Color.green().value,
+    "reject": discord.Color.red().value,
+    "remove": discord.Color.dark_red().value,
+})
+DEFAULT_STATUS_COLOR = discord.Color.greyple().value
+DEFAULT_VOTE_COLOR = discord.Color.blue().value
 
 
 def proposal_embed(proposal: dict, dao_id: str) -> discord.Embed:
@@ -243,7 +372,7 @@ def proposal_embed(proposal: dict, dao_id: str) -> discord.Embed:
 
     # Parse kind
     if isinstance(kind, dict):
-        kind_key = list(kind.keys())[0] if kind else "Unknown"
+        kind_key = next(iter(kind), "Unknown")
         kind_details = kind.get(kind_key, {})
     elif isinstance(kind, str):
         kind_key = kind
@@ -252,9 +381,9 @@ def proposal_embed(proposal: dict, dao_id: str) -> discord.Embed:
         kind_key = "Unknown"
         kind_details = {}
 
-    kind_label = KIND_LABELS.get(kind_key, kind_key)
-    color = STATUS_COLORS.get(status, discord.Color.greyple())
-    status_label = STATUS_LABELS.get(status, status)
+    kind_label = _kind_label(kind_key, kind_key)
+    color = _status_color(status, DEFAULT_STATUS_COLOR)
+    status_label = _status_label(status, status)
 
     # Description
     desc = proposal.get("description", "") or ""
@@ -274,10 +403,10 @@ def proposal_embed(proposal: dict, dao_id: str) -> discord.Embed:
     embed.add_field(name="DAO", value=f"`{dao_id}`", inline=True)
 
     # Vote tally
-    votes = proposal.get("votes", {})
-    approve_count = sum(1 for v in votes.values() if v == "Approve")
-    reject_count = sum(1 for v in votes.values() if v == "Reject")
-    remove_count = sum(1 for v in votes.values() if v == "Remove")
+    tally = Counter(proposal.get("votes", {}).values())
+    approve_count = tally["Approve"]
+    reject_count = tally["Reject"]
+    remove_count = tally["Remove"]
 
     vote_str = f"Approve: {approve_count} | Reject: {reject_count}"
     if remove_count > 0:
@@ -313,10 +442,11 @@ def proposal_embed(proposal: dict, dao_id: str) -> discord.Embed:
     sub_time = proposal.get("submission_time", "")
     if sub_time:
         try:
-            ts = int(sub_time) / 1e9
-            dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-            embed.set_footer(text=f"Submitted {dt.strftime('%Y-%m-%d %H:%M UTC')}")
-        except (ValueError, TypeError, OSError):
+            # Discord renders the embed timestamp next to the footer in the
+            # viewer's own timezone (markdown <t:...> tokens don't work in footers)
+            embed.timestamp = datetime.fromtimestamp(int(sub_time) // 10**9, tz=timezone.utc)
+            embed.set_footer(text="Submitted")
+        except (ValueError, TypeError, OSError, OverflowError):
             pass
 
     return embed
@@ -421,13 +551,17 @@ def treasury_embed(treasury: dict) -> discord.Embed:
 
 async def fetch_dao_info(dao_id: str) -> dict:
     """Fetch full DAO information from on-chain."""
-    account = await view_account(dao_id)
+    # Independent lookups: one round trip instead of three
+    account, policy, last_proposal = await asyncio.gather(
+        view_account(dao_id),
+        cached_view_call(dao_id, "get_policy"),
+        cached_view_call(dao_id, "get_last_proposal_id"),
+    )
     if "error" in account:
         return {"error": f"DAO not found: {dao_id}", "details": account}
 
     balance = yocto_to_near(account.get("amount", 0))
 
-    policy = await view_call(dao_id, "get_policy")
     if not isinstance(policy, dict):
         return {"error": f"Could not read policy for {dao_id}"}
 
@@ -450,7 +584,6 @@ async def fetch_dao_info(dao_id: str) -> dict:
             role_info["type"] = "everyone"
         roles.append(role_info)
 
-    last_proposal = await view_call(dao_id, "get_last_proposal_id")
     proposal_count = last_proposal if isinstance(last_proposal, int) else 0
 
     return {
@@ -466,23 +599,34 @@ async def fetch_dao_info(dao_id: str) -> dict:
     }
 
 
+def _drop_action_args(proposal: dict):
+    """Listings only show method names, so drop the (often large) base64 call args."""
+    kind = proposal.get("kind")
+    if isinstance(kind, dict) and isinstance(kind.get("FunctionCall"), dict):
+        for action in kind["FunctionCall"].get("actions", ()):
+            if isinstance(action, dict):
+                action["args"] = None
+
+
 async def fetch_proposals(dao_id: str, status: str = "all", limit: int = 10) -> dict:
     """Fetch proposals from a DAO contract."""
-    last_id = await view_call(dao_id, "get_last_proposal_id")
+    last_id = await cached_view_call(dao_id, "get_last_proposal_id")
     if not isinstance(last_id, int) or last_id == 0:
         return {"proposals": [], "total": 0, "dao_id": dao_id}
 
     from_index = max(0, last_id - limit)
-    proposals_raw = await view_call(dao_id, "get_proposals", {
+    proposals_raw = await cached_view_call(dao_id, "get_proposals", {
         "from_index": from_index,
         "limit": limit,
-    })
+    }, ttl=PROPOSALS_TTL)
 
     if not isinstance(proposals_raw, list):
         return {"error": f"Could not fetch proposals from {dao_id}"}
 
     proposals = []
     for i, p in enumerate(proposals_raw):
+        # In place, so the cached page doesn't hold on to the payloads either
+        _drop_action_args(p)
         p_status = p.get("status", "Unknown")
 
         if status != "all":
@@ -508,7 +652,23 @@ async def fetch_proposals(dao_id: str, status: str = "all", limit: int = 10) ->
 
 async def fetch_treasury(dao_id: str) -> dict:
     """Fetch DAO treasury details."""
-    account = await view_account(dao_id)
+    known_tokens = [
+        ("wrap.near", "wNEAR"),
+        ("token.ref-finance.near", "REF"),
+        ("usn", "USN"),
+        ("meta-pool.near", "stNEAR"),
+        ("aurora", "AURORA"),
+    ]
+
+    # Account and all balances in one concurrent burst, then metadata only
+    # for held tokens
+    account, *results = await asyncio.gather(
+        view_account(dao_id),
+        *(
+            view_call(token_contract, "ft_balance_of", {"account_id": dao_id})
+            for token_contract, _ in known_tokens
+        ),
+    )
     if "error" in account:
         return {"error": f"DAO not found: {dao_id}"}
 
@@ -516,31 +676,28 @@ async def fetch_treasury(dao_id: str) -> dict:
     staked = yocto_to_near(account.get("locked", 0))
     storage_bytes = account.get("storage_usage", 0)
 
-    known_tokens = [
-        ("wrap.near", "wNEAR"),
-        ("token.ref-finance.near", "REF"),
-        ("usn", "USN"),
-        ("meta-pool.near", "stNEAR"),
-        ("aurora", "AURORA"),
+    held = [
+        (token_contract, symbol, result)
+        for (token_contract, symbol), result in zip(known_tokens, results)
+        if isinstance(result, str) and result != "0"
     ]
+    metadatas = await asyncio.gather(*(
+        cached_view_call(token_contract, "ft_metadata", ttl=FT_METADATA_TTL)
+        for token_contract, _, _ in held
+    ))
 
     token_balances = []
-    for token_contract, symbol in known_tokens:
-        result = await view_call(token_contract, "ft_balance_of", {
-            "account_id": dao_id,
-        })
-        if isinstance(result, str) and result != "0":
-            metadata = await view_call(token_contract, "ft_metadata")
-            decimals = 24
-            if isinstance(metadata, dict):
-                decimals = metadata.get("decimals", 24)
-            balance = int(result) / (10 ** decimals)
-            if balance > 0.001:
-                token_balances.append({
-                    "token": symbol,
-                    "contract": token_contract,
-                    "balance": round(balance, 4),
-                })
+    for (token_contract, symbol, result), metadata in zip(held, metadatas):
+        decimals = 24
+        if isinstance(metadata, dict):
+            decimals = metadata.get("decimals", 24)
+        balance = int(result) / (10 ** decimals)
+        if balance > 0.001:
+            token_balances.append({
+                "token": symbol,
+                "contract": token_contract,
+                "balance": round(balance, 4),
+            })
 
     return {
         "dao_id": dao_id,
@@ -653,15 +810,9 @@ async def vote_command(
         f"--accountId {signer} --gas 200000000000000"
     )
 
-    action_colors = {
-        "approve": discord.Color.green(),
-        "reject": discord.Color.red(),
-        "remove": discord.Color.dark_red(),
-    }
-
     embed = discord.Embed(
         title=f"Vote {action.title()} on Proposal #{proposal_id}",
-        color=action_colors.get(action, discord.Color.blue()),
+        color=VOTE_COLORS.get(action, DEFAULT_VOTE_COLOR),
     )
     embed.add_field(name="DAO", value=f"`{dao_id}`", inline=True)
     embed.add_field(name="Action", value=vote_map[action], inline=True)
@@ -674,11 +825,11 @@ async def vote_command(
             embed.add_field(name="Proposal Description", value=desc, inline=False)
 
         p_status = proposal_data.get("status", "Unknown")
-        embed.add_field(name="Current Status", value=STATUS_LABELS.get(p_status, p_status), inline=True)
+        embed.add_field(name="Current Status", value=_status_label(p_status, p_status), inline=True)
 
-        votes = proposal_data.get("votes", {})
-        approve_n = sum(1 for v in votes.values() if v == "Approve")
-        reject_n = sum(1 for v in votes.values() if v == "Reject")
+        tally = Counter(proposal_data.get("votes", {}).values())
+        approve_n = tally["Approve"]
+        reject_n = tally["Reject"]
         embed.add_field(name="Current Votes", value=f"Approve: {approve_n} | Reject: {reject_n}", inline=True)
 
     embed.add_field(
@@ -743,7 +894,7 @@ async def propose_command(
                 "receiver_id": receiver,
                 "actions": [{
                     "method_name": "execute",
-                    "args": base64.b64encode(b"{}").decode(),
+                    "args": _EMPTY_ARGS_B64,
                     "deposit": "0",
                     "gas": "150000000000000",
                 }],
@@ -778,7 +929,7 @@ async def propose_command(
         return
 
     # Get proposal bond from the DAO policy
-    policy = await view_call(dao_id, "get_policy")
+    policy = await cached_view_call(dao_id, "get_policy")
     bond = "100000000000000000000000"  # Default 0.1 NEAR
     if isinstance(policy, dict):
         bond = policy.get("proposal_bond", bond)
@@ -804,7 +955,7 @@ async def propose_command(
         color=discord.Color.purple(),
     )
     embed.add_field(name="DAO", value=f"`{dao_id}`", inline=True)
-    embed.add_field(name="Type", value=KIND_LABELS.get(list(kind_payload.keys())[0], kind), inline=True)
+    embed.add_field(name="Type", value=_kind_label(next(iter(kind_payload)), kind), inline=True)
     embed.add_field(name="Bond Required", value=f"{format_near(bond_near)} NEAR", inline=True)
 
     if kind == "transfer":
@@ -868,7 +1019,7 @@ async def members_command(
 
     await interaction.response.defer()
 
-    policy = await view_call(dao_id, "get_policy")
+    policy = await cached_view_call(dao_id, "get_policy")
     if not isinstance(policy, dict):
         await interaction.followup.send(f"Could not read policy for `{dao_id}`.")
         return
@@ -987,11 +1138,6 @@ async def on_ready():
     print(f"RPC: {NEAR_RPC}")
     if DEFAULT_DAO:
         print(f"Default DAO: {DEFAULT_DAO}")
-    try:
-        synced = await bot.tree.sync()
-        print(f"Synced {len(synced)} slash commands")
-    except Exception as e:
-        print(f"Sync error: {e}")
 
 
 # ─── Entry Point ──────────────────────────────────────────────────